@@ -15,3 +15,21 @@ TOFU_IMAGE = PROJECT_ROOT / "assets" / "tofu.png"
 BINGO_GRID_SIZE = 5
 APP_TITLE = "Team Root Bingo"
 DEFAULT_SEED = 2018
+SAMPLER_MODE = "compat"
+
+SHEET_CACHE_MAX_ENTRIES = 512
+SHEET_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+ICON_PDF_DIR = PROJECT_ROOT / "assets" / "derived" / "pdf"
+STATIC_DIR = PROJECT_ROOT / "static"
+STATIC_URL = "app/static"
+ICON_WEB_DIR = STATIC_DIR / "icons"
+SPRITE_DIR = STATIC_DIR / "sprite"
+ICON_PDF_INCHES = 0.4
+ICON_PDF_DPI = 300
+ICON_WEB_PX = 100
+PDF_RENDERER = "canvas"
+
+# Cold `import app` must stay under this, and must not load these modules.
+STARTUP_IMPORT_BUDGET_MS = 400
+STARTUP_LAZY_MODULES = ("reportlab", "PIL", "pandas", "openpyxl", "numpy")
@@ -0,0 +1,102 @@
+# ----------------------------------
+# IMPORTS
+# ----------------------------------
+from html import escape
+from urllib.parse import quote
+import streamlit as st
+from src.utils.icons import sprite_css, sprite_icon_html, web_icon_url
+
+# ----------------------------------
+# CONSTANTS
+# ----------------------------------
+# The whole grid goes out as one HTML element. Icons come from the static
+# sprite atlas, so the browser fetches one cached file for the whole set
+# instead of receiving the images again on every rerun. Without a built
+# sprite they fall back to <img> tags for the single thumbnails.
+ICON_SIZE = 50
+GRID_CSS = """
+<style>
+.bingo-grid {
+    display: grid;
+    grid-template-columns: repeat(5, minmax(0, 1fr));
+    border-top: 1px solid rgba(128, 128, 128, 0.4);
+    border-left: 1px solid rgba(128, 128, 128, 0.4);
+}
+.bingo-cell {
+    display: flex;
+    flex-direction: column;
+    align-items: center;
+    justify-content: center;
+    gap: 0.25rem;
+    min-height: 9rem;
+    padding: 0.5rem;
+    border-right: 1px solid rgba(128, 128, 128, 0.4);
+    border-bottom: 1px solid rgba(128, 128, 128, 0.4);
+    text-align: center;
+}
+.bingo-cell.center {
+    background-color: rgba(255, 255, 160, 0.25);
+}
+.bingo-cell img {
+    width: %dpx;
+    height: %dpx;
+}
+.bingo-name {
+    font-weight: bold;
+}
+.bingo-name.elite {
+    text-decoration: underline;
+}
+.bingo-content {
+    font-size: 0.85rem;
+}
+%s
+</style>
+"""
+
+# ----------------------------------
+# HELPER FUNCTIONS
+# ----------------------------------
+def cell_html(cell, center=False):
+    classes = "bingo-cell center" if center else "bingo-cell"
+    if not cell:
+        return f'<div class="{classes}"></div>'
+
+    parts = [f'<div class="{classes}">']
+    sprite = sprite_icon_html(cell["icon"], ICON_SIZE)
+    icon_url = None if sprite else web_icon_url(cell["icon"])
+    if sprite:
+        parts.append(sprite)
+    elif icon_url:
+        if not icon_url.startswith("data:"):
+            icon_url = quote(icon_url)
+        parts.append(f'<img src="{icon_url}" alt="" loading="lazy">')
+    else:
+        parts.append("<em>(no icon)</em>")
+
+    name_classes = "bingo-name elite" if cell.get("is_elite") else "bingo-name"
+    parts.append(f'<div class="{name_classes}">{escape(cell["name"])}</div>')
+    parts.append(f'<div class="bingo-content">{escape(cell["content"])}</div>')
+    parts.append("</div>")
+    return "".join(parts)
+
+
+def grid_html(grid):
+    cells = "".join(
+        cell_html(grid[row][col], center=(row == 2 and col == 2))
+        for row in range(5)
+        for col in range(5)
+    )
+    css = GRID_CSS % (ICON_SIZE, ICON_SIZE, sprite_css(ICON_SIZE))
+    return f'{css}<div class="bingo-grid">{cells}</div>'
+
+
+# ----------------------------------
+# GRID COMPONENT
+# ----------------------------------
+def render_bingo_grid(grid):
+    if grid is None:
+        st.warning("Could not generate bingo grid")
+        return
+
+    st.html(grid_html(grid))
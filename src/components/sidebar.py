@@ -1,20 +1,25 @@
 # ----------------------------------
 # IMPORTS
 # ----------------------------------
+import importlib
 import streamlit as st
-from src.pages import bingo, home, achievements
+
+# ----------------------------------
+# CONSTANTS
+# ----------------------------------
+# Page modules are imported the first time their page is selected, so a
+# fresh worker only loads what the first request needs.
+PAGES = {
+    "Home": "src.pages.home",
+    "Bingo Sheet": "src.pages.bingo",
+    "Bingo Wiki": "src.pages.achievements"
+}
 
 # ----------------------------------
 # RENDER
 # ----------------------------------
 def render():
-    pages = {
-        "Home": home.render,
-        "Bingo Sheet": bingo.render,
-        "Bingo Wiki": achievements.render
-    }
-
     st.sidebar.title("Navigation")
-    selection = st.sidebar.radio("Go to", list(pages.keys()))
+    selection = st.sidebar.radio("Go to", list(PAGES.keys()))
 
-    pages[selection]()
\ No newline at end of file
+    importlib.import_module(PAGES[selection]).render()
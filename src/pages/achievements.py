@@ -2,47 +2,9 @@
 # IMPORTS
 # ----------------------------------
 import streamlit as st
-from src.utils.data_loader import load_achievements
+from src.utils.data_loader import load_catalog, CatalogError
 from src.components.filter import render_category_filters
-
-# ----------------------------------
-# HELPER FUNCTIONS
-# ----------------------------------
-def format_achievement_text(achievement):
-    name = achievement.get("name") or "Unnamed"
-    window = achievement.get("window") or ""
-    base = achievement.get("base") or ""
-    normal = achievement.get("normal")
-    elite = achievement.get("elite")
-
-    if normal and elite:
-        base_text = base.replace("{x}", f"[{normal} | {elite}]")
-    elif normal:
-        base_text = base.replace("{x}", str(normal))
-    elif elite:
-        base_text = base.replace("{x}", str(elite))
-    else:
-        base_text = base.replace("{x}", "")
-
-    display_text = f"**{name}** - {window}: {base_text}"
-    notes = achievement.get("notes")
-
-    return display_text, notes
-
-
-def display_achievements_list(achievements_dict):
-    for _achievement_id, achievement in achievements_dict.items():
-        if not isinstance(achievement, dict):
-            continue
-        display_text, notes = format_achievement_text(achievement)
-
-        col1, col2 = st.columns([10, 1])
-        with col1:
-            st.markdown(f"- {display_text}")
-        with col2:
-            if notes:
-                st.markdown("ℹ️", help=notes)
-
+from src.utils.wiki import search_html, wiki_html
 
 # ----------------------------------
 # RENDER MAIN
@@ -51,7 +13,13 @@ def render():
     st.title("Bingo Wiki")
     st.markdown("---")
 
-    achievements = load_achievements()
+    try:
+        catalog = load_catalog()
+    except CatalogError as e:
+        st.error(f"Could not load achievements: {e}")
+        return
+
+    achievements = catalog.achievements
 
     if not achievements:
         st.warning("No achievements loaded")
@@ -59,27 +27,29 @@ def render():
 
     selected_cat1, selected_cat2 = render_category_filters("achievements")
 
-    st.markdown("---")
-
-    for cat1 in selected_cat1:
-        if cat1 not in achievements:
-            continue
+    query = st.text_input(
+        "Search",
+        placeholder="Name, rule, window or notes",
+        type="search",
+        live=True,
+        key="achievements_search"
+    )
 
-        with st.expander(f"{cat1}", expanded=True):
-            cat1_data = achievements[cat1]
+    st.markdown("---")
 
-            for cat2_key, cat2_value in cat1_data.items():
-                if cat2_key not in selected_cat2:
-                    continue
+    if not query.strip():
+        st.html(wiki_html(catalog, selected_cat1, selected_cat2))
+        return
 
-                if not isinstance(cat2_value, dict):
-                    continue
+    selected_cat1, selected_cat2 = set(selected_cat1), set(selected_cat2)
+    indices = [
+        index for index, _score in catalog.search.search(query)
+        if catalog.records[index].cat1 in selected_cat1 and catalog.records[index].cat2 in selected_cat2
+    ]
 
-                with st.expander(f"{cat2_key}", expanded=False):
-                    achievements_in_cat2 = {k: v for k, v in cat2_value.items() if isinstance(v, dict)}
+    if not indices:
+        st.info(f"No achievements match \"{query.strip()}\"")
+        return
 
-                    for mode in ["Normal", "Elite", "Both"]:
-                        mode_achievements = {k: v for k, v in achievements_in_cat2.items() if v.get("mode") == mode}
-                        if mode_achievements:
-                            with st.expander(f"{mode}", expanded=False):
-                                display_achievements_list(mode_achievements)
+    st.caption(f"{len(indices)} matching achievements")
+    st.html(search_html(catalog, indices))
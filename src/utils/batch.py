@@ -0,0 +1,98 @@
+# ----------------------------------
+# IMPORTS
+# ----------------------------------
+import time
+from array import array
+from config.settings import SAMPLER_MODE
+from src.utils.sampler import SHEET_CELLS, prepare_plan, sample_indices
+from src.utils.seeds import derive_seed
+
+# ----------------------------------
+# CONSTANTS
+# ----------------------------------
+CELLS_PER_SHEET = SHEET_CELLS + 1
+EMPTY_CELL = -1
+
+# ----------------------------------
+# BATCH
+# ----------------------------------
+class SheetBatch:
+    """
+    Many sheets stored flat: sheet `i` occupies slots
+    [i * CELLS_PER_SHEET, (i + 1) * CELLS_PER_SHEET) of `indices` (catalog
+    record indices, EMPTY_CELL when the pool ran short) and `elite` (0/1).
+    Slot 0 of each sheet is the centre Bingo cell, the rest follow sampler
+    order, so `sheet(i)` matches what `sampler()` returns for that seed.
+    """
+
+    __slots__ = ("catalog", "difficulty_code", "seeds", "indices", "elite", "elapsed")
+
+    def __init__(self, catalog, difficulty_code, seeds):
+        self.catalog = catalog
+        self.difficulty_code = difficulty_code
+        self.seeds = seeds
+        self.indices = array("i")
+        self.elite = bytearray()
+        self.elapsed = 0.0
+
+    def __len__(self):
+        return len(self.seeds)
+
+    @property
+    def sheets_per_second(self):
+        return len(self) / self.elapsed if self.elapsed > 0 else float("inf")
+
+    def is_complete(self, i):
+        start = i * CELLS_PER_SHEET
+        return EMPTY_CELL not in self.indices[start:start + CELLS_PER_SHEET]
+
+    def sheet(self, i):
+        records = self.catalog.records
+        start = i * CELLS_PER_SHEET
+
+        result = [self.difficulty_code]
+        for slot in range(start, start + CELLS_PER_SHEET):
+            index = self.indices[slot]
+            if index == EMPTY_CELL:
+                break
+            result.append((records[index].id, bool(self.elite[slot])))
+
+        return result
+
+
+def generate_sheets(catalog, seeds, difficulty, selected_cat1, selected_faction_cat2, mode=SAMPLER_MODE):
+    """
+    Generate one sheet per seed with a single shared plan.
+    Returns None when the catalog has no Bingo achievement for `difficulty`.
+    """
+    start = time.perf_counter()
+
+    plan = prepare_plan(catalog, difficulty, selected_cat1, selected_faction_cat2, mode)
+    if plan is None:
+        return None
+
+    seeds = list(seeds)
+    records = catalog.records
+    bingo_index = catalog.index_of[plan.bingo_id]
+    bingo_is_elite = plan.difficulty_code != "n"
+
+    batch = SheetBatch(catalog, plan.difficulty_code, seeds)
+    indices = batch.indices
+    elite = batch.elite
+
+    for seed in seeds:
+        sampled = sample_indices(records, plan, derive_seed(seed))
+
+        indices.append(bingo_index)
+        elite.append(bingo_is_elite)
+        for index, is_elite in sampled:
+            indices.append(index)
+            elite.append(is_elite)
+
+        missing = SHEET_CELLS - len(sampled)
+        if missing > 0:
+            indices.extend([EMPTY_CELL] * missing)
+            elite.extend(bytes(missing))
+
+    batch.elapsed = time.perf_counter() - start
+    return batch
@@ -0,0 +1,295 @@
+# ----------------------------------
+# IMPORTS
+# ----------------------------------
+import argparse
+import hashlib
+import os
+import re
+import sys
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from src.utils.batch import generate_sheets
+from src.utils.data_loader import load_catalog
+from src.utils.grid import grid_placer
+from src.utils.pdf_export import generate_pdf, write_pdf_pack
+from src.utils.sampler import check_feasibility
+
+# ----------------------------------
+# CONSTANTS
+# ----------------------------------
+CHUNK_SEEDS = 16
+DIFFICULTIES = ["Normal", "Mixed", "Hard"]
+SEED_RANGE = re.compile(r"(\d+)-(\d+)")
+
+# Seeds made only of these characters name their file as they are. Any
+# other seed is made safe and gets a hash of the seed as typed appended.
+# Plain names have no "_" or capitals and hashed ones do, so no two seeds
+# share a file, even on a case-insensitive filesystem.
+PLAIN_SEED = re.compile(r"[a-z0-9.-]+")
+
+# ----------------------------------
+# WORKER
+# ----------------------------------
+# Set once per worker process by init_worker, so the catalog is loaded once
+# and reused for every chunk that worker renders.
+_worker = {}
+
+
+def init_worker(difficulty, selected_cat1, selected_faction_cat2):
+    _worker["catalog"] = load_catalog()
+    _worker["selection"] = (difficulty, selected_cat1, selected_faction_cat2)
+
+
+def render_chunk(seeds):
+    """
+    Returns [(seed, pdf bytes)] in the order of `seeds`.
+    """
+    catalog = _worker["catalog"]
+    difficulty, selected_cat1, selected_faction_cat2 = _worker["selection"]
+    batch = generate_sheets(catalog, seeds, difficulty, selected_cat1, selected_faction_cat2)
+
+    results = []
+    for i, seed in enumerate(seeds):
+        grid = grid_placer(catalog, batch.sheet(i))
+        results.append((seed, generate_pdf(grid, seed, difficulty).getvalue()))
+    return results
+
+
+# ----------------------------------
+# OUTPUT
+# ----------------------------------
+def sheet_filename(seed, difficulty):
+    seed = str(seed)
+    if not PLAIN_SEED.fullmatch(seed):
+        digest = hashlib.blake2b(seed.encode("utf-8"), digest_size=6).hexdigest()
+        seed = f"{re.sub(r'[^A-Za-z0-9.-]', '_', seed)}_{digest}"
+    return f"bingo_sheet_{seed}_{difficulty}.pdf"
+
+
+class DirectoryOutput:
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def existing(self):
+        return {path.name for path in self.path.glob("*.pdf")}
+
+    def write(self, name, data):
+        # Write then rename, so an interrupted run never leaves a partial
+        # file that a resumed run would skip.
+        target = self.path / name
+        tmp = target.with_suffix(".pdf.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, target)
+
+    def close(self):
+        pass
+
+
+class ZipOutput:
+    """
+    Sheets are staged as files in `<name>.zip.parts/` and packed into the
+    archive on close. A zip only becomes readable once its central
+    directory is written, so a killed run keeps its finished sheets in the
+    staging directory, where a resumed run finds them.
+    """
+
+    def __init__(self, path, resume=True):
+        self.path = Path(path)
+        self.staging = DirectoryOutput(self.path.with_name(self.path.name + ".parts"))
+        self.packed = []
+        self.written = []
+
+        if not resume:
+            for staged in self.staging.path.glob("*.pdf"):
+                staged.unlink()
+        elif self.path.exists():
+            try:
+                with zipfile.ZipFile(self.path) as archive:
+                    self.packed = archive.namelist()
+            except zipfile.BadZipFile:
+                print(f"{self.path} is unreadable, its sheets will be rendered again", file=sys.stderr)
+
+    def existing(self):
+        return set(self.packed) | self.staging.existing()
+
+    def write(self, name, data):
+        self.staging.write(name, data)
+        self.written.append(name)
+
+    def close(self):
+        # Sheets staged by an interrupted run come first, then this run's in
+        # the order they were written.
+        leftover = sorted(
+            (path for path in self.staging.path.glob("*.pdf") if path.name not in set(self.written)),
+            key=lambda path: path.stat().st_mtime_ns,
+        )
+        staged = [path.name for path in leftover] + self.written
+
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with zipfile.ZipFile(tmp, "w") as archive:
+            if self.packed:
+                with zipfile.ZipFile(self.path) as previous:
+                    for name in self.packed:
+                        if name not in set(staged):
+                            archive.writestr(previous.getinfo(name), previous.read(name))
+            for name in staged:
+                # PDF streams are already compressed.
+                archive.write(self.staging.path / name, name, compress_type=zipfile.ZIP_STORED)
+        os.replace(tmp, self.path)
+
+        for name in staged:
+            (self.staging.path / name).unlink()
+        for partial in self.staging.path.glob("*.tmp"):
+            partial.unlink()
+        self.staging.path.rmdir()
+
+
+# ----------------------------------
+# EXPORT
+# ----------------------------------
+def parse_seeds(values, seed_range):
+    """
+    Seeds in the order given, duplicates dropped. Raises ValueError for a
+    range that is not START-STOP with START <= STOP.
+    """
+    seeds = list(values or [])
+    if seed_range:
+        match = SEED_RANGE.fullmatch(seed_range.strip())
+        if match is None:
+            raise ValueError(f"--range must be START-STOP, e.g. 1-500, not {seed_range!r}")
+        start, stop = int(match.group(1)), int(match.group(2))
+        if start > stop:
+            raise ValueError(f"--range start {start} is after its end {stop}")
+        seeds.extend(str(seed) for seed in range(start, stop + 1))
+    return list(dict.fromkeys(seeds))
+
+
+def chunked(items, size):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def export_sheets(seeds, difficulty, selected_cat1, selected_faction_cat2, output, workers=None, resume=True):
+    """
+    Render one PDF per seed into `output`, in seed order. With `resume`,
+    seeds whose file is already present are skipped. Returns
+    (sheets written, sheets skipped, seconds).
+    """
+    start = time.perf_counter()
+    done = output.existing() if resume else set()
+    todo = [seed for seed in seeds if sheet_filename(seed, difficulty) not in done]
+
+    written = 0
+    if todo:
+        with ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count(),
+            initializer=init_worker,
+            initargs=(difficulty, selected_cat1, selected_faction_cat2),
+        ) as pool:
+            # map() yields chunks in submission order, which keeps the
+            # output order deterministic whatever order workers finish in.
+            for results in pool.map(render_chunk, chunked(todo, CHUNK_SEEDS)):
+                for seed, data in results:
+                    output.write(sheet_filename(seed, difficulty), data)
+                    written += 1
+
+    return written, len(seeds) - len(todo), time.perf_counter() - start
+
+
+def pack_sheets(catalog, seeds, difficulty, selected_cat1, selected_faction_cat2):
+    """
+    Yield (grid, seed, difficulty) for `write_pdf_pack`, sampling one chunk
+    of seeds at a time.
+    """
+    for chunk in chunked(seeds, CHUNK_SEEDS):
+        batch = generate_sheets(catalog, chunk, difficulty, selected_cat1, selected_faction_cat2)
+        for i, seed in enumerate(chunk):
+            yield grid_placer(catalog, batch.sheet(i)), seed, difficulty
+
+
+def export_pack(catalog, seeds, difficulty, selected_cat1, selected_faction_cat2, path):
+    """
+    Render every seed as one page of a single print-pack PDF at `path`.
+    Returns (pages, seconds).
+    """
+    start = time.perf_counter()
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    sheets = pack_sheets(catalog, seeds, difficulty, selected_cat1, selected_faction_cat2)
+    with open(tmp, "wb") as f:
+        pages = write_pdf_pack(sheets, f)
+    os.replace(tmp, path)
+    return pages, time.perf_counter() - start
+
+
+# ----------------------------------
+# MAIN
+# ----------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Render bingo sheet PDFs without the web app")
+    parser.add_argument("seeds", nargs="*", help="seeds to render")
+    parser.add_argument("--range", dest="seed_range", help="inclusive numeric seed range, e.g. 1-500")
+    parser.add_argument("--difficulty", default="Normal", choices=DIFFICULTIES)
+    parser.add_argument("--categories", nargs="*", default=["General", "Faction"], help="category 1 selection")
+    parser.add_argument("--factions", nargs="*", default=None, help="factions to include (default: all)")
+    parser.add_argument("--out", default="sheets", help="output directory, or a .zip file")
+    parser.add_argument("--pack", help="write one multi-page print-pack PDF to this path instead")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--no-resume", action="store_true", help="re-render sheets that already exist")
+    args = parser.parse_args()
+
+    try:
+        seeds = parse_seeds(args.seeds, args.seed_range)
+    except ValueError as error:
+        parser.error(str(error))
+    if not seeds:
+        parser.error("no seeds given")
+
+    catalog = load_catalog()
+    selected_cat1 = list(args.categories)
+    if "General" not in selected_cat1:
+        selected_cat1.append("General")
+    selected_faction_cat2 = args.factions
+    if selected_faction_cat2 is None:
+        selected_faction_cat2 = sorted(catalog.achievements.get("Faction", {}).keys())
+    if "Faction" not in selected_cat1:
+        selected_faction_cat2 = []
+
+    feasibility = check_feasibility(catalog, args.difficulty, selected_cat1, selected_faction_cat2)
+    if not feasibility.feasible:
+        print(f"Selection cannot fill a sheet: {feasibility.fillable + 1} of 25 cells", file=sys.stderr)
+        sys.exit(1)
+
+    if args.pack:
+        pages, seconds = export_pack(
+            catalog, seeds, args.difficulty, selected_cat1, selected_faction_cat2, args.pack
+        )
+        rate = pages / seconds if seconds > 0 else 0.0
+        print(f"Wrote a {pages}-page pack to {args.pack} in {seconds:.2f}s ({rate:.1f} pages/s)")
+        return
+
+    if args.out.endswith(".zip"):
+        output = ZipOutput(args.out, resume=not args.no_resume)
+    else:
+        output = DirectoryOutput(args.out)
+    try:
+        written, skipped, seconds = export_sheets(
+            seeds,
+            args.difficulty,
+            selected_cat1,
+            selected_faction_cat2,
+            output,
+            workers=args.workers,
+            resume=not args.no_resume,
+        )
+    finally:
+        output.close()
+
+    rate = written / seconds if seconds > 0 else 0.0
+    print(f"Wrote {written} sheets to {args.out} in {seconds:.2f}s ({rate:.1f} sheets/s), skipped {skipped}")
+
+
+if __name__ == "__main__":
+    main()
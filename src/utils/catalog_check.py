@@ -0,0 +1,139 @@
+# ----------------------------------
+# IMPORTS
+# ----------------------------------
+import sys
+import tempfile
+from pathlib import Path
+import pandas as pd
+from src.utils.compiled_catalog import CompiledCatalog, CompiledCatalogError, compile_catalog
+from src.utils.data_ingestor import FIELD_COLUMNS, build_achievements, validate_ids
+from src.utils.data_loader import Catalog, CatalogError
+
+# ----------------------------------
+# FIXTURES
+# ----------------------------------
+def sheet(rows):
+    """
+    A spreadsheet as pandas reads it: rows are (Category 1, Category 2, ID),
+    blank cells are None and every other column is filled in.
+    """
+    columns = {
+        "Category 1": [row[0] for row in rows],
+        "Category 2": [row[1] for row in rows],
+        "ID": [row[2] for row in rows],
+    }
+    for column in FIELD_COLUMNS.values():
+        columns[column] = [f"{column} {i}" for i in range(len(rows))]
+    return pd.DataFrame(columns)
+
+
+VALID_ROWS = [
+    ("General", "Actions", "1"),
+    ("General", "Actions", "2"),
+    ("Faction", "Cats", "3"),
+]
+
+# (label, rows, text the error must contain)
+INVALID_SHEETS = [
+    ("missing ID", VALID_ROWS + [("Faction", "Cats", None)], "without an ID: 5"),
+    ("duplicate ID", VALID_ROWS + [("Faction", "Birds", "2")], "'2' in rows 3, 5"),
+    ("missing Category 2", VALID_ROWS + [("Faction", None, "4")], "without a Category 2: 5"),
+    ("blank Category 2", [("Faction", "  ", "4")] + VALID_ROWS, "without a Category 2: 2"),
+]
+
+# Achievements dicts both load paths must reject: (label, achievements)
+INVALID_CATALOGS = [
+    ("achievements without a Category 2", {"Faction": {"Cats": {"3": {"name": "a"}}, "_achievements": [{"name": "b"}]}}),
+    ("Category 2 that is not a dict", {"Faction": {"Cats": "3"}}),
+    ("record that is not a dict", {"Faction": {"Cats": {"3": {"name": "a"}, "4": "b"}}}),
+]
+
+# ----------------------------------
+# CHECKS
+# ----------------------------------
+def check_ingest():
+    failures = []
+
+    df = sheet(VALID_ROWS)
+    try:
+        validate_ids(df)
+    except CatalogError as error:
+        failures.append(f"valid sheet rejected: {error}")
+    result = build_achievements(df)
+    if sorted(result["General"]["Actions"]) != ["1", "2"] or list(result["Faction"]) != ["Cats"]:
+        failures.append(f"valid sheet built as {result}")
+
+    for label, rows, expected in INVALID_SHEETS:
+        try:
+            validate_ids(sheet(rows))
+        except CatalogError as error:
+            if expected not in str(error):
+                failures.append(f"{label}: expected {expected!r} in {str(error)!r}")
+        else:
+            failures.append(f"{label}: accepted")
+
+    return failures
+
+
+def load_compiled(achievements, directory):
+    path = Path(directory) / "achievements.bin"
+    path.write_bytes(compile_catalog(achievements, "00" * 32))
+    return Catalog.from_compiled(CompiledCatalog(path))
+
+
+def check_load_paths():
+    """
+    The JSON and compiled catalogs must accept and reject the same input,
+    and serve the same records when they accept it.
+    """
+    failures = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        achievements = build_achievements(sheet(VALID_ROWS))
+        from_json = Catalog(achievements, "00" * 32)
+        from_compiled = load_compiled(achievements, directory)
+        json_records = [(r.id, r.cat1, r.cat2, r.data) for r in from_json.records]
+        compiled_records = [(r.id, r.cat1, r.cat2, r.data) for r in from_compiled.records]
+        if json_records != compiled_records:
+            failures.append("compiled records differ from the JSON records")
+        from_compiled.compiled.close()
+
+        for label, bad in INVALID_CATALOGS:
+            try:
+                Catalog(bad, "00" * 32)
+            except CatalogError:
+                pass
+            else:
+                failures.append(f"JSON loader accepted {label}")
+
+            try:
+                load_compiled(bad, directory).compiled.close()
+            except CompiledCatalogError:
+                pass
+            else:
+                failures.append(f"compiled catalog accepted {label}")
+
+    return failures
+
+
+# ----------------------------------
+# MAIN
+# ----------------------------------
+def main():
+    failures = []
+
+    print("ingest: spreadsheet validation")
+    failures += check_ingest()
+
+    print("load: JSON and compiled catalogs agree")
+    failures += check_load_paths()
+
+    for failure in failures:
+        print(f"  FAIL {failure}")
+
+    print("OK" if not failures else f"{len(failures)} failure(s)")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
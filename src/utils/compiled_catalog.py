@@ -0,0 +1,261 @@
+# ----------------------------------
+# IMPORTS
+# ----------------------------------
+import mmap
+import struct
+from config.settings import DATA_DIR
+
+# ----------------------------------
+# CONSTANTS
+# ----------------------------------
+COMPILED_PATH = DATA_DIR / "achievements.bin"
+
+MAGIC = b"RBCATLG\0"
+FORMAT_VERSION = 2
+
+# magic, format version, reserved, source sha256, source mtime_ns, source
+# size, string count, record count, group count, id index offset, strings
+# offset, records offset, groups offset, buckets offset
+HEADER = struct.Struct("<8sHH32sQQIIIIIIII")
+UINT32 = struct.Struct("<I")
+
+MODES = ("Normal", "Elite", "Both")
+
+FIELDS = ("name", "icon", "mode", "window", "base", "normal", "elite", "notes")
+# id, cat1, cat2 followed by FIELDS, all as string table ids
+RECORD = struct.Struct("<" + "I" * (3 + len(FIELDS)))
+# cat1, cat2, first record, end record
+GROUP = struct.Struct("<IIII")
+# id string, record index; sorted by id
+ID_ENTRY = struct.Struct("<II")
+# Per group, len(MODES) + 1 offsets into the bucket index array, which holds
+# each group's record indices by mode, in catalog order within a mode.
+BUCKET_OFFSETS = struct.Struct("<" + "I" * (len(MODES) + 1))
+
+NO_STRING = 0xFFFFFFFF
+
+
+class CompiledCatalogError(ValueError):
+    pass
+
+
+# ----------------------------------
+# WRITER
+# ----------------------------------
+class _StringTable:
+    def __init__(self):
+        self.ids = {}
+        self.values = []
+
+    def intern(self, value):
+        if value is None:
+            return NO_STRING
+        if not isinstance(value, str):
+            raise CompiledCatalogError(f"Cannot compile non-string value {value!r}")
+        if value not in self.ids:
+            self.ids[value] = len(self.values)
+            self.values.append(value)
+        return self.ids[value]
+
+    def encode(self):
+        blobs = [value.encode("utf-8") for value in self.values]
+        offsets = [0]
+        for blob in blobs:
+            offsets.append(offsets[-1] + len(blob))
+        return struct.pack(f"<{len(offsets)}I", *offsets) + b"".join(blobs)
+
+
+def _align(data, size=4):
+    return data + b"\0" * (-len(data) % size)
+
+
+def compile_catalog(achievements, source_sha256, source_stamp=(0, 0)):
+    """
+    Serialize an achievements dict into the compiled binary layout.
+    `source_stamp` is the (mtime_ns, size) of the JSON it was built from, so
+    a loader can trust the file without hashing the JSON again.
+    Raises CompiledCatalogError on a Category 2 or record that is not a
+    dict, as the JSON loader does.
+    """
+    strings = _StringTable()
+    records = []
+    groups = []
+    id_entries = []
+    bucket_offsets = []
+    bucket_indices = []
+
+    for cat1, cat1_data in achievements.items():
+        for cat2, cat2_data in cat1_data.items():
+            if not isinstance(cat2_data, dict):
+                raise CompiledCatalogError(f"{cat1} / {cat2} is not a set of achievements keyed by ID")
+
+            start = len(records)
+            by_mode = {mode: [] for mode in MODES}
+            for achievement_id, achievement in cat2_data.items():
+                if not isinstance(achievement, dict):
+                    raise CompiledCatalogError(f"Achievement {achievement_id!r} in {cat1} / {cat2} is not a record")
+                if achievement.get("mode") in by_mode:
+                    by_mode[achievement.get("mode")].append(len(records))
+                id_entries.append((achievement_id, len(records)))
+                records.append(RECORD.pack(
+                    strings.intern(achievement_id),
+                    strings.intern(cat1),
+                    strings.intern(cat2),
+                    *(strings.intern(achievement.get(field)) for field in FIELDS)
+                ))
+            groups.append(GROUP.pack(strings.intern(cat1), strings.intern(cat2), start, len(records)))
+
+            offsets = [len(bucket_indices)]
+            for mode in MODES:
+                bucket_indices.extend(by_mode[mode])
+                offsets.append(len(bucket_indices))
+            bucket_offsets.append(BUCKET_OFFSETS.pack(*offsets))
+
+    id_entries.sort()
+    id_index = b"".join(ID_ENTRY.pack(strings.ids[achievement_id], index) for achievement_id, index in id_entries)
+
+    string_blob = _align(strings.encode())
+    record_blob = b"".join(records)
+    group_blob = b"".join(groups)
+    bucket_blob = b"".join(bucket_offsets) + struct.pack(f"<{len(bucket_indices)}I", *bucket_indices)
+
+    id_index_offset = HEADER.size
+    strings_offset = id_index_offset + len(id_index)
+    records_offset = strings_offset + len(string_blob)
+    groups_offset = records_offset + len(record_blob)
+    buckets_offset = groups_offset + len(group_blob)
+
+    header = HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        0,
+        bytes.fromhex(source_sha256),
+        *source_stamp,
+        len(strings.values),
+        len(records),
+        len(groups),
+        id_index_offset,
+        strings_offset,
+        records_offset,
+        groups_offset,
+        buckets_offset,
+    )
+
+    return header + id_index + string_blob + record_blob + group_blob + bucket_blob
+
+
+def file_stamp(path):
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def write_compiled_catalog(achievements, source_sha256, source_path, path=COMPILED_PATH):
+    data = compile_catalog(achievements, source_sha256, file_stamp(source_path))
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    tmp_path.replace(path)
+    return path
+
+
+# ----------------------------------
+# READER
+# ----------------------------------
+class CompiledCatalog:
+    """
+    Read-only view of a compiled catalog backed by a shared, read-only mmap.
+    Strings are decoded on first access and memoized per process.
+    """
+
+    def __init__(self, path=COMPILED_PATH):
+        with open(path, "rb") as f:
+            self._buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._buf) < HEADER.size:
+            raise CompiledCatalogError(f"{path} is truncated")
+
+        (
+            magic,
+            version,
+            _reserved,
+            source_sha256,
+            source_mtime_ns,
+            source_size,
+            self.string_count,
+            self.record_count,
+            self.group_count,
+            self._id_index_offset,
+            self._strings_offset,
+            self._records_offset,
+            self._groups_offset,
+            self._buckets_offset,
+        ) = HEADER.unpack_from(self._buf, 0)
+
+        if magic != MAGIC:
+            raise CompiledCatalogError(f"{path} is not a compiled catalog")
+        if version != FORMAT_VERSION:
+            raise CompiledCatalogError(f"{path} has format version {version}, expected {FORMAT_VERSION}")
+
+        self.source_sha256 = source_sha256.hex()
+        self.source_stamp = (source_mtime_ns, source_size)
+        self._indices = memoryview(self._buf).cast("I")
+        self._bucket_base = (self._buckets_offset + BUCKET_OFFSETS.size * self.group_count) // UINT32.size
+        self._blob_offset = self._strings_offset + UINT32.size * (self.string_count + 1)
+        self._strings = {}
+
+    def close(self):
+        self._indices.release()
+        self._buf.close()
+
+    def string(self, sid):
+        if sid == NO_STRING:
+            return None
+        value = self._strings.get(sid)
+        if value is None:
+            start, end = struct.unpack_from("<II", self._buf, self._strings_offset + UINT32.size * sid)
+            value = self._buf[self._blob_offset + start:self._blob_offset + end].decode("utf-8")
+            self._strings[sid] = value
+        return value
+
+    def record(self, index):
+        sids = RECORD.unpack_from(self._buf, self._records_offset + RECORD.size * index)
+        return tuple(self.string(sid) for sid in sids)
+
+    def groups(self):
+        for i in range(self.group_count):
+            cat1, cat2, start, stop = GROUP.unpack_from(self._buf, self._groups_offset + GROUP.size * i)
+            yield self.string(cat1), self.string(cat2), start, stop
+
+    def buckets(self, group):
+        """
+        {mode: record indices} of the group at position `group`, read
+        straight from the mapped index array.
+        """
+        offsets = BUCKET_OFFSETS.unpack_from(self._buf, self._buckets_offset + BUCKET_OFFSETS.size * group)
+        base = self._bucket_base
+        return {
+            mode: tuple(self._indices[base + offsets[i]:base + offsets[i + 1]])
+            for i, mode in enumerate(MODES)
+        }
+
+    def ids(self):
+        """
+        Achievement IDs in ID order.
+        """
+        for i in range(self.record_count):
+            sid, _index = ID_ENTRY.unpack_from(self._buf, self._id_index_offset + ID_ENTRY.size * i)
+            yield self.string(sid)
+
+    def find(self, achievement_id):
+        lo, hi = 0, self.record_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            sid, index = ID_ENTRY.unpack_from(self._buf, self._id_index_offset + ID_ENTRY.size * mid)
+            value = self.string(sid)
+            if value == achievement_id:
+                return index
+            if value < achievement_id:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
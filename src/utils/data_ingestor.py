@@ -1,50 +1,192 @@
 # ----------------------------------
 # IMPORTS
 # ----------------------------------
+import argparse
+import hashlib
 import json
-import pandas as pd
+import time
 from config.settings import DATA_DIR
+from src.utils.compiled_catalog import COMPILED_PATH, write_compiled_catalog
+from src.utils.data_loader import INVALID_IDS, CatalogError
 
 # ----------------------------------
-# FUNCTIONS
+# CONSTANTS
+# ----------------------------------
+EXCEL_PATH = DATA_DIR / "achievements.xlsx"
+JSON_PATH = DATA_DIR / "achievements.json"
+MANIFEST_PATH = DATA_DIR / "achievements.manifest.json"
+
+FIELD_COLUMNS = {
+    "name": "Name",
+    "icon": "Icon",
+    "mode": "Mode",
+    "window": "Window",
+    "base": "Base",
+    "normal": "Normal",
+    "elite": "Elite",
+    "notes": "Notes",
+}
+
+# ----------------------------------
+# HELPER FUNCTIONS
 # ----------------------------------
-def ingest_achievements():
-    excel_path = DATA_DIR / "achievements.xlsx"
-    json_path = DATA_DIR / "achievements.json"
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def category_sha256(category_data):
+    encoded = json.dumps(category_data, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def load_manifest():
+    if not MANIFEST_PATH.exists():
+        return {}
+    with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_manifest(manifest):
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=4)
+
 
-    df = pd.read_excel(excel_path)
+def column_strings(df, column, missing=None):
+    values = df[column]
+    strings = values.astype(str).tolist()
+    present = values.notna().tolist()
+    return [value if is_present else missing for value, is_present in zip(strings, present)]
+
+
+def validate_ids(df):
+    """
+    Raise CatalogError for rows with a missing or repeated ID, or without a
+    Category 2. A later row overwrites an earlier one with the same ID, rows
+    are keyed by ID in the JSON, and the loader rejects achievements that
+    sit outside a Category 2, so each of these would break the catalog.
+    """
+    ids = df["ID"].astype(str).str.strip()
+    # Spreadsheet row numbers: one header row, 1-based.
+    rows = df.index + 2
+
+    missing = df["ID"].isna() | ids.isin(INVALID_IDS)
+    if missing.any():
+        raise CatalogError(f"Rows without an ID: {', '.join(map(str, rows[missing]))}")
+
+    no_category = df["Category 2"].isna() | (df["Category 2"].astype(str).str.strip() == "")
+    if no_category.any():
+        raise CatalogError(f"Rows without a Category 2: {', '.join(map(str, rows[no_category]))}")
+
+    duplicated = ids.duplicated(keep=False)
+    if duplicated.any():
+        groups = {}
+        for achievement_id, row in zip(ids[duplicated], rows[duplicated]):
+            groups.setdefault(achievement_id, []).append(str(row))
+        details = "; ".join(f"{achievement_id!r} in rows {', '.join(found)}" for achievement_id, found in groups.items())
+        raise CatalogError(f"Duplicate achievement IDs: {details}")
+
+
+def build_achievements(df):
+    """
+    Build the nested achievements dict from the spreadsheet column-wise:
+    every column is converted to strings/None in one vectorized pass and the
+    rows are then zipped together without per-row Series access.
+    """
+    category1 = column_strings(df, "Category 1", "Uncategorized")
+    category2 = column_strings(df, "Category 2")
+    ids = df["ID"].astype(str).tolist()
+    fields = list(FIELD_COLUMNS)
+    columns = [column_strings(df, column) for column in FIELD_COLUMNS.values()]
 
     result = {}
 
-    for _, row in df.iterrows():
-        category1 = str(row["Category 1"]) if pd.notna(row["Category 1"]) else "Uncategorized"
-        category2 = str(row["Category 2"]) if pd.notna(row["Category 2"]) else None
-
-        if category1 not in result:
-            result[category1] = {}
-
-        achievement_data = {
-            "name": str(row["Name"]) if pd.notna(row["Name"]) else None,
-            "icon": str(row["Icon"]) if pd.notna(row["Icon"]) else None,
-            "mode": str(row["Mode"]) if pd.notna(row["Mode"]) else None,
-            "window": str(row["Window"]) if pd.notna(row["Window"]) else None,
-            "base": str(row["Base"]) if pd.notna(row["Base"]) else None,
-            "normal": str(row["Normal"]) if pd.notna(row["Normal"]) else None,
-            "elite": str(row["Elite"]) if pd.notna(row["Elite"]) else None,
-            "notes": str(row["Notes"]) if pd.notna(row["Notes"]) else None,
-        }
-
-        if category2:
-            if category2 not in result[category1]:
-                result[category1][category2] = {}
-            result[category1][category2][str(row["ID"])] = achievement_data
-        else:
-            if "_achievements" not in result[category1]:
-                result[category1]["_achievements"] = []
-            result[category1]["_achievements"].append(achievement_data)
-
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(result, f, indent=4, ensure_ascii=False)
-
-    print(f"Exported achievements to {json_path}")
+    for cat1, cat2, achievement_id, *values in zip(category1, category2, ids, *columns):
+        cat1_data = result.setdefault(cat1, {})
+        cat1_data.setdefault(cat2, {})[achievement_id] = dict(zip(fields, values))
+
     return result
+
+
+def diff_categories(result, previous_hashes):
+    hashes = {cat1: category_sha256(cat1_data) for cat1, cat1_data in result.items()}
+    changed = [cat1 for cat1, digest in hashes.items() if previous_hashes.get(cat1) != digest]
+    removed = [cat1 for cat1 in previous_hashes if cat1 not in hashes]
+    return hashes, changed, removed
+
+
+# ----------------------------------
+# FUNCTIONS
+# ----------------------------------
+def ingest_achievements(compiled=False, force=False):
+    """
+    Convert achievements.xlsx to achievements.json.
+    Skips all work when the spreadsheet hash matches the last ingest, and
+    only rewrites the outputs when at least one Category 1 changed.
+    """
+    start = time.perf_counter()
+    manifest = load_manifest()
+    xlsx_sha256 = file_sha256(EXCEL_PATH)
+
+    outputs_present = JSON_PATH.exists() and (not compiled or COMPILED_PATH.exists())
+    if not force and outputs_present and manifest.get("xlsx_sha256") == xlsx_sha256:
+        print(f"{EXCEL_PATH.name} unchanged, skipping ingest ({time.perf_counter() - start:.3f}s)")
+        with open(JSON_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    # pandas (and openpyxl under it) only loads when the sheet has changed.
+    import pandas as pd
+
+    df = pd.read_excel(EXCEL_PATH)
+    read_done = time.perf_counter()
+
+    validate_ids(df)
+    result = build_achievements(df)
+    build_done = time.perf_counter()
+
+    hashes, changed, removed = diff_categories(result, manifest.get("categories", {}))
+
+    if force or changed or removed or not outputs_present:
+        with open(JSON_PATH, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=4, ensure_ascii=False)
+
+        print(f"Exported achievements to {JSON_PATH}")
+        if changed:
+            print(f"  changed: {', '.join(changed)}")
+        if removed:
+            print(f"  removed: {', '.join(removed)}")
+
+        if compiled:
+            compiled_path = write_compiled_catalog(result, file_sha256(JSON_PATH), JSON_PATH)
+            print(f"Compiled achievements to {compiled_path}")
+    else:
+        print("No category changed, outputs left untouched")
+
+    save_manifest({"xlsx_sha256": xlsx_sha256, "categories": hashes})
+    end = time.perf_counter()
+
+    print(
+        f"Ingested {len(df)} rows in {end - start:.3f}s "
+        f"(read {read_done - start:.3f}s, build {build_done - read_done:.3f}s, "
+        f"write {end - build_done:.3f}s)"
+    )
+    return result
+
+
+# ----------------------------------
+# MAIN
+# ----------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Convert achievements.xlsx to achievements.json")
+    parser.add_argument("--compiled", action="store_true", help="also write the compiled binary catalog")
+    parser.add_argument("--force", action="store_true", help="rebuild even if the spreadsheet is unchanged")
+    args = parser.parse_args()
+
+    ingest_achievements(compiled=args.compiled, force=args.force)
+
+
+if __name__ == "__main__":
+    main()
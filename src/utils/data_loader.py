@@ -1,22 +1,478 @@
 # ----------------------------------
 # IMPORTS
 # ----------------------------------
+import hashlib
 import json
-from config.settings import DATA_DIR
+import subprocess
+import sys
+import threading
+from collections.abc import Mapping, Sequence
+from config.settings import DATA_DIR, PROJECT_ROOT
+from src.utils.compiled_catalog import FIELDS, MODES, COMPILED_PATH, CompiledCatalog, CompiledCatalogError
+from src.utils.formatting import format_cell_text, format_wiki_text, list_icon_files, resolve_icon_path
+from src.utils.search import SearchIndex
 
 # ----------------------------------
-# FUNCTIONS
+# CONSTANTS
 # ----------------------------------
-def load_achievements():
-    filepath = DATA_DIR / "achievements.json"
+ACHIEVEMENTS_PATH = DATA_DIR / "achievements.json"
+INVALID_IDS = {"", "nan", "None"}
+DIFFICULTY_MODES = {
+    "n": ("Both", "Normal"),
+    "e": ("Both", "Elite"),
+    "m": ("Both", "Normal", "Elite"),
+}
+
+# ----------------------------------
+# CATALOG
+# ----------------------------------
+class CatalogError(ValueError):
+    pass
+
+
+def build_id_index(achievements):
+    """
+    Build the flat `id -> achievement` and `id -> (cat1, cat2)` indexes.
+    Raises CatalogError on duplicate or missing IDs, and on a Category 2 or
+    record that is not a dict.
+    """
+    by_id = {}
+    locations = {}
+
+    for cat1, cat1_data in achievements.items():
+        for cat2, cat2_data in cat1_data.items():
+            if isinstance(cat2_data, list):
+                raise CatalogError(f"{len(cat2_data)} achievement(s) without an ID in {cat1} (no Category 2)")
+
+            if not isinstance(cat2_data, dict):
+                raise CatalogError(f"{cat1} / {cat2} is not a set of achievements keyed by ID")
+
+            for achievement_id, achievement in cat2_data.items():
+                if not isinstance(achievement, dict):
+                    raise CatalogError(f"Achievement {achievement_id!r} in {cat1} / {cat2} is not a record")
+
+                if achievement_id is None or str(achievement_id).strip() in INVALID_IDS:
+                    raise CatalogError(f"Achievement without an ID in {cat1} / {cat2}")
+
+                if achievement_id in by_id:
+                    first_cat1, first_cat2 = locations[achievement_id]
+                    raise CatalogError(
+                        f"Duplicate achievement ID {achievement_id!r} in "
+                        f"{first_cat1} / {first_cat2} and {cat1} / {cat2}"
+                    )
+
+                by_id[achievement_id] = achievement
+                locations[achievement_id] = (cat1, cat2)
+
+    return by_id, locations
+
+
+class AchievementRecord:
+    """
+    One achievement with its display strings rendered once at load time:
+    sheet cell text for both variants, the wiki line, and the resolved icon
+    path (NO_ICON when the icon is unset or missing on disk).
+    """
+
+    __slots__ = (
+        "index", "id", "cat1", "cat2", "mode", "data",
+        "name", "icon_path", "normal_text", "elite_text", "wiki_text", "notes"
+    )
+
+    def __init__(self, index, achievement_id, cat1, cat2, data, icon_files):
+        self.index = index
+        self.id = achievement_id
+        self.cat1 = cat1
+        self.cat2 = cat2
+        self.mode = data.get("mode")
+        self.data = data
+        self.name = data.get("name") or "Unnamed"
+        self.icon_path = resolve_icon_path(data.get("icon"), icon_files)
+        self.normal_text = format_cell_text(data, False)
+        self.elite_text = format_cell_text(data, True)
+        self.wiki_text = format_wiki_text(data)
+        self.notes = data.get("notes")
+
+    def cell_text(self, is_elite):
+        return self.elite_text if is_elite else self.normal_text
+
+
+class CategoryGroup:
+    """
+    Contiguous run of record indices for one (cat1, cat2) pair, pre-split by
+    mode and by difficulty code. All tuples keep catalog order.
+    """
+
+    __slots__ = ("cat1", "cat2", "start", "stop", "by_mode", "by_difficulty")
+
+    def __init__(self, cat1, cat2, start, stop, by_mode):
+        self.cat1 = cat1
+        self.cat2 = cat2
+        self.start = start
+        self.stop = stop
+        self.by_mode = by_mode
+        self.by_difficulty = {
+            code: tuple(sorted(index for mode in valid_modes for index in by_mode[mode]))
+            for code, valid_modes in DIFFICULTY_MODES.items()
+        }
+
+    @classmethod
+    def from_records(cls, cat1, cat2, records):
+        start = records[0].index if records else 0
+        stop = records[-1].index + 1 if records else 0
+        by_mode = {
+            mode: tuple(r.index for r in records if r.mode == mode)
+            for mode in MODES
+        }
+        return cls(cat1, cat2, start, stop, by_mode)
+
+
+def unique_keys(pairs):
+    """
+    object_pairs_hook for json.loads: a repeated key means a duplicate
+    achievement ID in one Category 2, which plain dicts would drop.
+    """
+    result = {}
+    for key, value in pairs:
+        if key in result:
+            raise CatalogError(f"Duplicate key {key!r} in achievements file")
+        result[key] = value
+    return result
+
+
+def build_records(achievements, icon_files):
+    # Runs after build_id_index, which has rejected non-dict entries.
+    records = []
+    groups = {}
+
+    for cat1, cat1_data in achievements.items():
+        for cat2, cat2_data in cat1_data.items():
+            group_records = []
+            for achievement_id, achievement in cat2_data.items():
+                record = AchievementRecord(len(records), achievement_id, cat1, cat2, achievement, icon_files)
+                records.append(record)
+                group_records.append(record)
+
+            groups[(cat1, cat2)] = CategoryGroup.from_records(cat1, cat2, group_records)
+
+    return records, groups
+
+
+class Catalog:
+    """
+    Process-wide snapshot of achievements.json.
+    One instance is shared by every session and script thread, so it must be
+    treated as read-only. `version` is the sha256 of the file contents.
+    The search index is built on first use.
+    """
+
+    __slots__ = (
+        "achievements", "version", "by_id", "locations", "records", "index_of", "groups", "compiled",
+        "_search", "_search_lock"
+    )
+
+    def __init__(self, achievements, version):
+        self.achievements = achievements
+        self.version = version
+        self.by_id, self.locations = build_id_index(achievements)
+        self.records, self.groups = build_records(achievements, list_icon_files())
+        self.index_of = {record.id: record.index for record in self.records}
+        self.compiled = None
+        self._search = None
+        self._search_lock = threading.Lock()
+
+    @classmethod
+    def from_compiled(cls, compiled):
+        """
+        Catalog whose records and lookups read from the mapped file on
+        demand: nothing is decoded up front, and records are built the
+        first time they are used.
+        """
+        catalog = cls.__new__(cls)
+        catalog.compiled = compiled
+        catalog.version = compiled.source_sha256
+        catalog.records = CompiledRecords(compiled)
+        catalog.index_of = CompiledIdIndex(compiled, lambda index: index)
+        catalog.by_id = CompiledIdIndex(compiled, lambda index: catalog.records[index].data)
+        catalog.locations = CompiledIdIndex(compiled, lambda index: (catalog.records[index].cat1, catalog.records[index].cat2))
+        catalog.groups = {
+            (cat1, cat2): CategoryGroup(cat1, cat2, start, stop, compiled.buckets(i))
+            for i, (cat1, cat2, start, stop) in enumerate(compiled.groups())
+        }
+        catalog.achievements = CompiledAchievements(catalog)
+        catalog._search = None
+        catalog._search_lock = threading.Lock()
+        return catalog
+
+    @property
+    def search(self):
+        if self._search is None:
+            with self._search_lock:
+                if self._search is None:
+                    self._search = SearchIndex(self.records)
+        return self._search
+
+    def get(self, achievement_id):
+        return self.by_id.get(achievement_id)
+
+
+# ----------------------------------
+# COMPILED VIEWS
+# ----------------------------------
+# Read-only stand-ins for the Catalog containers, backed by a CompiledCatalog.
+class CompiledRecords(Sequence):
+    def __init__(self, compiled):
+        self._compiled = compiled
+        self._records = [None] * compiled.record_count
+        self._icon_files = None
+
+    def __len__(self):
+        return len(self._records)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        record = self._records[index]
+        if record is None:
+            if self._icon_files is None:
+                self._icon_files = list_icon_files()
+            achievement_id, cat1, cat2, *values = self._compiled.record(index)
+            data = dict(zip(FIELDS, values))
+            record = AchievementRecord(index, achievement_id, cat1, cat2, data, self._icon_files)
+            self._records[index] = record
+        return record
+
+
+class CompiledIdIndex(Mapping):
+    """
+    `achievement id -> value(record index)`, looked up by binary search in
+    the file's sorted ID index.
+    """
+
+    def __init__(self, compiled, value):
+        self._compiled = compiled
+        self._value = value
+
+    def __getitem__(self, achievement_id):
+        index = self._compiled.find(achievement_id) if isinstance(achievement_id, str) else None
+        if index is None:
+            raise KeyError(achievement_id)
+        return self._value(index)
+
+    def __iter__(self):
+        return self._compiled.ids()
+
+    def __len__(self):
+        return self._compiled.record_count
 
-    if not filepath.exists():
-        return {}
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        return json.load(f)
+class CompiledAchievements(Mapping):
+    """
+    The nested `cat1 -> cat2 -> id -> achievement` dict, from the group
+    table. Achievement dicts come from the shared records.
+    """
+
+    def __init__(self, catalog):
+        self._tree = {}
+        for (cat1, cat2), group in catalog.groups.items():
+            self._tree.setdefault(cat1, {})[cat2] = CompiledGroup(catalog.records, group)
+
+    def __getitem__(self, cat1):
+        return self._tree[cat1]
+
+    def __iter__(self):
+        return iter(self._tree)
+
+    def __len__(self):
+        return len(self._tree)
+
+
+class CompiledGroup(Mapping):
+    def __init__(self, records, group):
+        self._records = records
+        self._group = group
+        self._ids = None
+
+    def _index(self):
+        if self._ids is None:
+            records = self._records
+            self._ids = {records[i].id: i for i in range(self._group.start, self._group.stop)}
+        return self._ids
+
+    def __getitem__(self, achievement_id):
+        return self._records[self._index()[achievement_id]].data
+
+    def __iter__(self):
+        return iter(self._index())
+
+    def __len__(self):
+        return self._group.stop - self._group.start
+
+
+EMPTY_CATALOG = Catalog({}, None)
+
+_cache_lock = threading.Lock()
+_cache = {"catalog": None, "stamp": None}
+_stats = {"hits": 0, "misses": 0}
+
+
+def _file_stamp(filepath):
+    try:
+        stat = filepath.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _open_compiled(compiled_path):
+    if not compiled_path.exists():
+        return None
+
+    try:
+        return CompiledCatalog(compiled_path)
+    except (OSError, CompiledCatalogError):
+        return None
+
+
+def _read_catalog(filepath, compiled_path, cached):
+    # A compiled file stamped with the JSON's current mtime and size is
+    # trusted as is. Otherwise the JSON is hashed, and the compiled file is
+    # still used when it was built from identical content.
+    stamp = _file_stamp(filepath)
+    compiled = _open_compiled(compiled_path)
+    if compiled is not None and (stamp is None or compiled.source_stamp == stamp):
+        if cached is not None and compiled.source_sha256 == cached.version:
+            compiled.close()
+            return cached
+        return Catalog.from_compiled(compiled)
+
+    if stamp is None:
+        return EMPTY_CATALOG
+
+    with open(filepath, "rb") as f:
+        raw = f.read()
+    version = hashlib.sha256(raw).hexdigest()
+
+    if cached is not None and version == cached.version:
+        if compiled is not None:
+            compiled.close()
+        return cached
+
+    if compiled is not None:
+        if compiled.source_sha256 == version:
+            return Catalog.from_compiled(compiled)
+        compiled.close()
+
+    return Catalog(json.loads(raw.decode("utf-8"), object_pairs_hook=unique_keys), version)
+
+
+def load_catalog(filepath=ACHIEVEMENTS_PATH, compiled_path=COMPILED_PATH):
+    """
+    Return the shared Catalog, re-reading the files only when their mtime/size
+    changed, and re-building it only when the JSON content hash changed.
+    A compiled catalog built from the current JSON is preferred; the JSON
+    file is the fallback.
+    """
+    with _cache_lock:
+        stamp = (filepath, compiled_path, _file_stamp(filepath), _file_stamp(compiled_path))
+        if stamp[2:] == (None, None):
+            _cache["catalog"] = None
+            _cache["stamp"] = None
+            return EMPTY_CATALOG
+
+        cached = _cache["catalog"]
+        if cached is not None and stamp == _cache["stamp"]:
+            _stats["hits"] += 1
+            return cached
+
+        catalog = _read_catalog(filepath, compiled_path, cached)
+        _cache["stamp"] = stamp
+
+        if catalog is cached:
+            _stats["hits"] += 1
+            return cached
+
+        _cache["catalog"] = catalog
+        _stats["misses"] += 1
+        return catalog
+
+
+def get_cache_stats():
+    with _cache_lock:
+        catalog = _cache["catalog"]
+        return {
+            "hits": _stats["hits"],
+            "misses": _stats["misses"],
+            "version": catalog.version if catalog is not None else None,
+            "compiled": catalog is not None and catalog.compiled is not None,
+        }
+
+
+def clear_cache():
+    with _cache_lock:
+        _cache["catalog"] = None
+        _cache["stamp"] = None
+        _stats["hits"] = 0
+        _stats["misses"] = 0
+
+
+# ----------------------------------
+# FUNCTIONS
+# ----------------------------------
+def load_achievements():
+    return load_catalog().achievements
 
 
 def get_category1_keys():
     achievements = load_achievements()
     return list(achievements.keys())
+
+
+# ----------------------------------
+# STARTUP MEASUREMENT
+# ----------------------------------
+_MEASURE_SNIPPET = """
+import json, resource, sys, time
+from pathlib import Path
+from src.utils import data_loader
+rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+catalog = data_loader.load_catalog(compiled_path=Path(sys.argv[1]))
+elapsed = time.perf_counter() - start
+rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({
+    "compiled": catalog.compiled is not None,
+    "load_ms": elapsed * 1000,
+    "rss_kb": rss_after,
+    "rss_delta_kb": rss_after - rss_before,
+}))
+"""
+
+
+def measure_startup(compiled_path=COMPILED_PATH):
+    """
+    Load the catalog in a fresh interpreter, once via the compiled file and
+    once via JSON only, and return load time and peak RSS for each path.
+    """
+    results = {}
+    for label, path in (("compiled", compiled_path), ("json", compiled_path.with_suffix(".missing"))):
+        output = subprocess.run(
+            [sys.executable, "-c", _MEASURE_SNIPPET, str(path)],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        results[label] = json.loads(output)
+    return results
+
+
+if __name__ == "__main__":
+    for label, result in measure_startup().items():
+        print(
+            f"{label:>8}: {result['load_ms']:.2f} ms, "
+            f"peak RSS {result['rss_kb']} KB (+{result['rss_delta_kb']} KB), "
+            f"compiled={result['compiled']}"
+        )
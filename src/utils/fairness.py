@@ -0,0 +1,299 @@
+# ----------------------------------
+# IMPORTS
+# ----------------------------------
+import argparse
+import itertools
+import math
+import time
+import numpy as np
+from src.utils.data_loader import load_catalog
+from src.utils.sampler import SHEET_CELLS, prepare_plan
+from src.utils.sampler_check import simulate
+
+# ----------------------------------
+# CONSTANTS
+# ----------------------------------
+DEFAULT_SEEDS = 1_000_000
+CHUNK_SEEDS = 100_000
+CHECK_SEEDS = 20_000
+SWEEP_SEEDS = 20_000
+
+# ----------------------------------
+# REPORT
+# ----------------------------------
+class FairnessReport:
+    """
+    Monte Carlo estimate for one filter configuration.
+    `inclusion[i]` is the probability that pool item i is on a sheet,
+    `elite_rate[i]` the probability it is on a sheet as elite, and
+    `bucket_share[name]` the expected fraction of the 24 cells per bucket.
+    """
+
+    __slots__ = ("ids", "buckets", "trials", "inclusion", "elite_rate", "bucket_share", "elapsed")
+
+    def __init__(self, ids, buckets, trials, inclusion, elite_rate, bucket_share, elapsed):
+        self.ids = ids
+        self.buckets = buckets
+        self.trials = trials
+        self.inclusion = inclusion
+        self.elite_rate = elite_rate
+        self.bucket_share = bucket_share
+        self.elapsed = elapsed
+
+
+# ----------------------------------
+# SIMULATION
+# ----------------------------------
+# Each chunk simulates many seeds at once. A uniform random permutation is the
+# sort order of uniform keys, so "shuffle then take the first k" becomes
+# "the k smallest keys", with k allowed to differ per seed.
+def smallest(keys, k, exclude=None):
+    """
+    Boolean mask of the k[row] smallest keys in each row, never selecting
+    `exclude`d entries.
+    """
+    if exclude is not None:
+        keys = np.where(exclude, np.inf, keys)
+    rows, size = keys.shape
+    ordered = np.concatenate((np.full((rows, 1), -np.inf), np.sort(keys, axis=1)), axis=1)
+    threshold = np.take_along_axis(ordered, np.clip(k, 0, size)[:, None], axis=1)
+    mask = keys <= threshold
+    return mask if exclude is None else mask & ~exclude
+
+
+def bucket_quotas(rng, trials, num_buckets):
+    base_per_bucket, remainder = divmod(SHEET_CELLS, num_buckets)
+    bonus = smallest(rng.random((trials, num_buckets)), np.full(trials, remainder))
+    return base_per_bucket + bonus
+
+
+def simulate_chunk(plan, layout, trials, rng):
+    """
+    Returns (included, elite) boolean arrays of shape (trials, pool size).
+    """
+    sizes, offsets, modes = layout
+    pool_size = int(sizes.sum())
+    num_buckets = len(sizes)
+    quotas = bucket_quotas(rng, trials, num_buckets)
+
+    included = np.zeros((trials, pool_size), dtype=bool)
+    elite = np.zeros((trials, pool_size), dtype=bool)
+
+    if plan.difficulty_code != "m":
+        taken = np.minimum(quotas, sizes)
+
+        # Leftover phase: repeatedly pick a uniformly random non-empty bucket
+        # and take its next item, until 24 cells or everything is used.
+        need = SHEET_CELLS - taken.sum(axis=1)
+        for _ in range(SHEET_CELLS):
+            active = need > 0
+            open_buckets = (taken < sizes) & active[:, None]
+            open_count = open_buckets.sum(axis=1)
+            active &= open_count > 0
+            if not active.any():
+                break
+            pick = np.floor(rng.random(trials) * np.maximum(open_count, 1)).astype(np.int64)
+            chosen = (np.cumsum(open_buckets, axis=1) == (pick + 1)[:, None]) & open_buckets
+            chosen &= active[:, None]
+            taken += chosen
+            need -= chosen.sum(axis=1)
+
+        for b, size in enumerate(sizes):
+            start = offsets[b]
+            included[:, start:start + size] = smallest(rng.random((trials, size)), taken[:, b])
+
+        elite[:] = included & ((modes == "Elite") | (plan.difficulty_code == "e"))
+        return included, elite
+
+    for b, size in enumerate(sizes):
+        start = offsets[b]
+        bucket_modes = modes[start:start + size]
+        normal_side = bucket_modes != "Elite"
+        elite_side = bucket_modes != "Normal"
+        normal_quota = (quotas[:, b] + 1) // 2
+        elite_quota = quotas[:, b] - normal_quota
+
+        normal_exclude = np.broadcast_to(~normal_side, (trials, size))
+        normal_pick = smallest(rng.random((trials, size)), normal_quota, normal_exclude)
+
+        elite_exclude = ~elite_side | normal_pick
+        elite_pick = smallest(rng.random((trials, size)), elite_quota, elite_exclude)
+
+        included[:, start:start + size] = normal_pick | elite_pick
+        elite[:, start:start + size] = elite_pick
+
+    need = SHEET_CELLS - included.sum(axis=1)
+    leftover = smallest(rng.random((trials, pool_size)), need, included)
+    included |= leftover
+    elite |= leftover & (modes == "Elite")
+    return included, elite
+
+
+def pool_layout(catalog, plan):
+    ids = []
+    buckets = []
+    sizes = []
+    modes = []
+    for name, bucket in plan.buckets.items():
+        buckets.append(name)
+        sizes.append(len(bucket.items))
+        for index in bucket.items:
+            ids.append(catalog.records[index].id)
+            modes.append(catalog.records[index].mode)
+
+    sizes = np.array(sizes, dtype=np.int64)
+    offsets = np.concatenate(([0], np.cumsum(sizes)[:-1])).astype(np.int64)
+    return ids, buckets, (sizes, offsets, np.array(modes, dtype=object))
+
+
+def simulate_fairness(
+    catalog,
+    difficulty,
+    selected_cat1,
+    selected_faction_cat2,
+    trials=DEFAULT_SEEDS,
+    seed=0,
+    chunk=CHUNK_SEEDS,
+):
+    start = time.perf_counter()
+    plan = prepare_plan(catalog, difficulty, selected_cat1, selected_faction_cat2)
+    if plan is None or not plan.buckets:
+        return None
+
+    ids, buckets, layout = pool_layout(catalog, plan)
+    sizes, offsets, _modes = layout
+    rng = np.random.default_rng(seed)
+
+    inclusion = np.zeros(len(ids), dtype=np.int64)
+    elite = np.zeros(len(ids), dtype=np.int64)
+
+    remaining = trials
+    while remaining > 0:
+        n = min(chunk, remaining)
+        included, is_elite = simulate_chunk(plan, layout, n, rng)
+        inclusion += included.sum(axis=0)
+        elite += is_elite.sum(axis=0)
+        remaining -= n
+
+    bucket_share = {
+        name: inclusion[offsets[b]:offsets[b] + sizes[b]].sum() / (trials * SHEET_CELLS)
+        for b, name in enumerate(buckets)
+    }
+
+    return FairnessReport(
+        ids,
+        buckets,
+        trials,
+        inclusion / trials,
+        elite / trials,
+        bucket_share,
+        time.perf_counter() - start,
+    )
+
+
+# ----------------------------------
+# CROSS-CHECK
+# ----------------------------------
+def cross_check(catalog, difficulty, selected_cat1, selected_faction_cat2, trials=CHECK_SEEDS):
+    """
+    Compare the vectorized estimate against the reference Python sampler on
+    `trials` seeds. Returns the largest two-sample z score over item
+    inclusion and elite rates; values under ~5 mean the models agree.
+    """
+    report = simulate_fairness(catalog, difficulty, selected_cat1, selected_faction_cat2, trials=trials)
+    if report is None:
+        return 0.0
+
+    plan = prepare_plan(catalog, difficulty, selected_cat1, selected_faction_cat2, mode="compat")
+    _, inclusion, elite, _ = simulate(catalog, plan, range(trials))
+
+    worst = 0.0
+    for i, achievement_id in enumerate(report.ids):
+        index = catalog.index_of[achievement_id]
+        for estimate, counts in ((report.inclusion[i], inclusion), (report.elite_rate[i], elite)):
+            reference = counts[index] / trials
+            p = (estimate + reference) / 2
+            stderr = math.sqrt(max(p * (1 - p), 1e-12) * 2 / trials)
+            worst = max(worst, abs(estimate - reference) / stderr)
+    return worst
+
+
+# ----------------------------------
+# SWEEP
+# ----------------------------------
+def sweep_faction_subsets(catalog, difficulty, trials=SWEEP_SEEDS, min_factions=0):
+    """
+    Simulate every subset of factions (General always on) and yield
+    (factions, report) pairs.
+    """
+    factions = sorted(catalog.achievements.get("Faction", {}).keys())
+    for size in range(min_factions, len(factions) + 1):
+        for subset in itertools.combinations(factions, size):
+            cat1 = ["General", "Faction"] if subset else ["General"]
+            report = simulate_fairness(catalog, difficulty, cat1, list(subset), trials=trials)
+            if report is not None:
+                yield list(subset), report
+
+
+# ----------------------------------
+# MAIN
+# ----------------------------------
+def print_report(report):
+    print(f"{report.trials} seeds in {report.elapsed:.2f}s")
+    print("Bucket shares:")
+    for name, share in sorted(report.bucket_share.items(), key=lambda item: -item[1]):
+        print(f"  {name:<20} {share:7.2%}  ({share * SHEET_CELLS:.2f} cells)")
+    print("Items (inclusion, elite):")
+    for i in np.argsort(-report.inclusion):
+        print(f"  {report.ids[i]:>6} {report.inclusion[i]:7.2%} {report.elite_rate[i]:7.2%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo fairness analysis of the bingo sampler")
+    parser.add_argument("--difficulty", default="Normal", choices=["Normal", "Mixed", "Hard"])
+    parser.add_argument("--factions", nargs="*", default=None, help="factions to include (default: all)")
+    parser.add_argument(
+        "--seeds",
+        type=int,
+        default=None,
+        help=f"seeds to simulate (default: {DEFAULT_SEEDS}, or {SWEEP_SEEDS} per subset with --sweep)"
+    )
+    parser.add_argument("--check", action="store_true", help="cross-check against the Python sampler")
+    parser.add_argument("--sweep", action="store_true", help="summarize every faction subset")
+    args = parser.parse_args()
+
+    catalog = load_catalog()
+    factions = args.factions
+    if factions is None:
+        factions = sorted(catalog.achievements.get("Faction", {}).keys())
+    cat1 = ["General", "Faction"] if factions else ["General"]
+
+    if args.sweep:
+        start = time.perf_counter()
+        trials = args.seeds if args.seeds is not None else SWEEP_SEEDS
+        for subset, report in sweep_faction_subsets(catalog, args.difficulty, trials=trials):
+            shares = report.bucket_share.values()
+            print(
+                f"{','.join(subset) or '-':<60} "
+                f"inclusion {report.inclusion.min():6.2%}..{report.inclusion.max():6.2%} "
+                f"bucket share {min(shares):6.2%}..{max(shares):6.2%}",
+                flush=True,
+            )
+        print(f"Sweep finished in {time.perf_counter() - start:.1f}s")
+        return
+
+    if args.check:
+        z = cross_check(catalog, args.difficulty, cat1, factions)
+        print(f"max |z| vs reference sampler: {z:.2f}")
+        return
+
+    trials = args.seeds if args.seeds is not None else DEFAULT_SEEDS
+    report = simulate_fairness(catalog, args.difficulty, cat1, factions, trials=trials)
+    if report is None:
+        print("Nothing to sample for this selection")
+        return
+    print_report(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# ----------------------------------
+# IMPORTS
+# ----------------------------------
+from html import escape
+from config.settings import ICONS_DIR
+
+# ----------------------------------
+# CONSTANTS
+# ----------------------------------
+NO_ICON = None
+
+# ----------------------------------
+# FUNCTIONS
+# ----------------------------------
+def list_icon_files(icons_dir=ICONS_DIR):
+    return {path.stem: str(path) for path in icons_dir.glob("*.png")}
+
+
+def resolve_icon_path(icon_name, icon_files):
+    if not icon_name:
+        return NO_ICON
+    return icon_files.get(icon_name, NO_ICON)
+
+
+def fill_template(base, value):
+    return (base or "").replace("{x}", str(value) if value else "")
+
+
+def format_cell_text(achievement, is_elite):
+    window = achievement.get("window") or ""
+    value = achievement.get("elite") if is_elite else achievement.get("normal")
+    return f"[{window}] {fill_template(achievement.get('base'), value)}"
+
+
+def wiki_value(achievement):
+    normal = achievement.get("normal")
+    elite = achievement.get("elite")
+
+    if normal and elite:
+        return f"[{normal} | {elite}]"
+    return normal or elite
+
+
+def format_wiki_text(achievement):
+    name = achievement.get("name") or "Unnamed"
+    window = achievement.get("window") or ""
+    return f"**{name}** - {window}: {fill_template(achievement.get('base'), wiki_value(achievement))}"
+
+
+def format_wiki_html(achievement):
+    name = escape(achievement.get("name") or "Unnamed")
+    window = escape(achievement.get("window") or "")
+    text = escape(fill_template(achievement.get("base"), wiki_value(achievement)))
+    return f"<b>{name}</b> - {window}: {text}"
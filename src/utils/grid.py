@@ -0,0 +1,47 @@
+# ----------------------------------
+# FUNCTIONS
+# ----------------------------------
+def get_record_by_id(catalog, achievement_id):
+    index = catalog.index_of.get(achievement_id)
+    return catalog.records[index] if index is not None else None
+
+
+def make_cell(record, is_elite):
+    return {
+        "id": record.id,
+        "icon": record.icon_path,
+        "name": record.name,
+        "content": record.cell_text(is_elite),
+        "is_elite": is_elite
+    }
+
+
+def grid_placer(catalog, sampled_list):
+    if sampled_list is None or len(sampled_list) < 26:
+        return None
+
+    bingo_id, bingo_is_elite = sampled_list[1]
+    other_items = sampled_list[2:]
+
+    grid = [[None for _ in range(5)] for _ in range(5)]
+
+    bingo_record = get_record_by_id(catalog, bingo_id)
+    if bingo_record:
+        grid[2][2] = make_cell(bingo_record, bingo_is_elite)
+
+    idx = 0
+    for row in range(5):
+        for col in range(5):
+            if row == 2 and col == 2:
+                continue
+
+            if idx < len(other_items):
+                achievement_id, is_elite = other_items[idx]
+                record = get_record_by_id(catalog, achievement_id)
+
+                if record:
+                    grid[row][col] = make_cell(record, is_elite)
+
+                idx += 1
+
+    return grid
@@ -0,0 +1,309 @@
+# ----------------------------------
+# IMPORTS
+# ----------------------------------
+import argparse
+import base64
+import hashlib
+import io
+import json
+import math
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from config.settings import (
+    ICONS_DIR,
+    ICON_PDF_DIR,
+    ICON_WEB_DIR,
+    ICON_PDF_INCHES,
+    ICON_PDF_DPI,
+    ICON_WEB_PX,
+    STATIC_DIR,
+    STATIC_URL,
+    SPRITE_DIR,
+)
+
+# ----------------------------------
+# CONSTANTS
+# ----------------------------------
+# Icons are opaque RGB art, so the print copy is a JPEG: reportlab embeds it
+# as-is instead of decoding and re-compressing the pixels for every PDF.
+PDF_PX = round(ICON_PDF_INCHES * ICON_PDF_DPI)
+PDF_FORMAT = ("JPEG", ".jpg", {"quality": 90, "optimize": True})
+WEB_FORMAT = ("PNG", ".png", {"optimize": True})
+SPRITE_MANIFEST = "sprite.json"
+
+# Pillow and reportlab are imported by the functions that use them, so the
+# pages that only need the sprite map or thumbnail URLs load neither.
+_lock = threading.Lock()
+_resolved = {}
+_readers = {}
+
+# ----------------------------------
+# DERIVATIVES
+# ----------------------------------
+def derivative_path(icon_path, target_dir, suffix):
+    return target_dir / f"{Path(icon_path).stem}{suffix}"
+
+
+def encode_icon(source, px, image_format):
+    from PIL import Image
+
+    name, _suffix, options = image_format
+    with Image.open(source) as image:
+        image = image.convert("RGB")
+        image.thumbnail((px, px), Image.LANCZOS)
+        buffer = io.BytesIO()
+        image.save(buffer, name, **options)
+    return buffer.getvalue()
+
+
+def build_derivatives(icons_dir=ICONS_DIR, force=False):
+    """
+    Write the print and web copies of every icon. Returns
+    {stem: (original bytes, pdf bytes, web bytes)}.
+    """
+    sizes = {}
+    targets = ((ICON_PDF_DIR, PDF_PX, PDF_FORMAT), (ICON_WEB_DIR, ICON_WEB_PX, WEB_FORMAT))
+    for target_dir, _px, _format in targets:
+        target_dir.mkdir(parents=True, exist_ok=True)
+
+    for source in sorted(icons_dir.glob("*.png")):
+        written = []
+        for target_dir, px, image_format in targets:
+            path = derivative_path(source, target_dir, image_format[1])
+            if force or not is_fresh(source, path):
+                path.write_bytes(encode_icon(source, px, image_format))
+            written.append(path.stat().st_size)
+        sizes[source.stem] = (source.stat().st_size, *written)
+
+    with _lock:
+        _resolved.clear()
+        _readers.clear()
+    return sizes
+
+
+def is_fresh(source, derived):
+    return derived.exists() and derived.stat().st_mtime_ns >= Path(source).stat().st_mtime_ns
+
+
+def _resolve(icon_path, target_dir, suffix):
+    # Falls back to the original when the derivative is missing. Freshness is
+    # left to the build step: a fresh clone's mtimes say nothing about it.
+    key = (icon_path, target_dir)
+    with _lock:
+        path = _resolved.get(key)
+    if path is None:
+        derived = derivative_path(icon_path, target_dir, suffix)
+        path = str(derived) if derived.exists() else str(icon_path)
+        with _lock:
+            _resolved[key] = path
+    return path
+
+
+def pdf_icon_path(icon_path):
+    return _resolve(icon_path, ICON_PDF_DIR, PDF_FORMAT[1])
+
+
+def web_icon_path(icon_path):
+    if not icon_path:
+        return icon_path
+    return _resolve(icon_path, ICON_WEB_DIR, WEB_FORMAT[1])
+
+
+def web_icon_url(icon_path):
+    """
+    URL of the web thumbnail under Streamlit's static serving, or an inline
+    data URI when the thumbnail has not been built.
+    """
+    if not icon_path:
+        return None
+    path = Path(web_icon_path(icon_path))
+    if path.is_relative_to(STATIC_DIR):
+        return f"{STATIC_URL}/{path.relative_to(STATIC_DIR).as_posix()}"
+    return inline_icon_uri(icon_path, ICON_WEB_PX)
+
+
+@lru_cache(maxsize=256)
+def inline_icon_uri(icon_path, px, quality=85):
+    """
+    Icon as a small JPEG data URI, made once per process from the print copy.
+    """
+    from PIL import Image
+
+    with Image.open(pdf_icon_path(icon_path)) as image:
+        image = image.convert("RGB").resize((px, px), Image.LANCZOS)
+        buffer = io.BytesIO()
+        image.save(buffer, "JPEG", quality=quality, optimize=True)
+    return "data:image/jpeg;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def get_pdf_image(icon_path, derived=True):
+    """
+    Shared ImageReader per icon. The reader keeps its decoded data, and
+    reportlab embeds identical images once per document.
+
+    Sessions render in their own threads, so the reader is decoded before it
+    is shared, and each JPEG embed reads a stream of its own: reportlab's
+    jpeg_fh seeks and returns the reader's single file handle.
+    """
+    from reportlab.lib.utils import ImageReader
+
+    path = pdf_icon_path(icon_path) if derived else str(icon_path)
+    with _lock:
+        reader = _readers.get(path)
+        if reader is None:
+            data = Path(path).read_bytes()
+            reader = ImageReader(io.BytesIO(data))
+            reader.getSize()
+            reader.getRGBData()
+            if reader.jpeg_fh() is not None:
+                reader.jpeg_fh = lambda: io.BytesIO(data)
+            _readers[path] = reader
+    return reader
+
+
+# ----------------------------------
+# SPRITE
+# ----------------------------------
+# Every web icon packed into one atlas whose file name carries a hash of its
+# bytes, so a browser downloads the set once and a changed set gets a new
+# URL. sprite.json maps each icon name (the `icon` field, e.g. "-cat") to
+# its top-left corner in the atlas.
+def build_sprite(icons_dir=ICONS_DIR, sprite_dir=SPRITE_DIR, px=ICON_WEB_PX):
+    """
+    Write the atlas and its map, removing atlases of older builds. Returns
+    the map.
+    """
+    from PIL import Image
+
+    sources = sorted(Path(icons_dir).glob("*.png"))
+    columns = max(1, math.ceil(math.sqrt(len(sources))))
+    rows = max(1, math.ceil(len(sources) / columns))
+    atlas = Image.new("RGB", (columns * px, rows * px), "white")
+    positions = {}
+
+    for i, source in enumerate(sources):
+        x, y = (i % columns) * px, (i // columns) * px
+        with Image.open(source) as image:
+            image = image.convert("RGB")
+            image.thumbnail((px, px), Image.LANCZOS)
+            atlas.paste(image, (x, y))
+        positions[source.stem] = [x, y]
+
+    buffer = io.BytesIO()
+    atlas.save(buffer, WEB_FORMAT[0], **WEB_FORMAT[2])
+    data = buffer.getvalue()
+    name = f"icons.{hashlib.blake2b(data, digest_size=6).hexdigest()}.png"
+
+    sprite_dir = Path(sprite_dir)
+    sprite_dir.mkdir(parents=True, exist_ok=True)
+    if not (sprite_dir / name).exists():
+        (sprite_dir / name).write_bytes(data)
+    for old in sprite_dir.glob("icons.*.png"):
+        if old.name != name:
+            old.unlink()
+
+    manifest = {"image": name, "px": px, "width": atlas.width, "height": atlas.height, "icons": positions}
+    (sprite_dir / SPRITE_MANIFEST).write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    load_sprite.cache_clear()
+    sprite_css.cache_clear()
+    return manifest
+
+
+@lru_cache(maxsize=1)
+def load_sprite(sprite_dir=SPRITE_DIR):
+    """
+    The sprite map, or None when no atlas has been built.
+    """
+    try:
+        manifest = json.loads((Path(sprite_dir) / SPRITE_MANIFEST).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not (Path(sprite_dir) / manifest["image"]).exists():
+        return None
+    return manifest
+
+
+@lru_cache(maxsize=8)
+def sprite_css(size):
+    """
+    Rule for `.icon-sprite` elements drawn `size` CSS pixels wide.
+    """
+    sprite = load_sprite()
+    if sprite is None:
+        return ""
+    scale = size / sprite["px"]
+    url = f"{STATIC_URL}/{SPRITE_DIR.relative_to(STATIC_DIR).as_posix()}/{sprite['image']}"
+    return (
+        f".icon-sprite-{size} {{display: inline-block; width: {size}px; height: {size}px; "
+        f"vertical-align: middle; background: url({url}) no-repeat; "
+        f"background-size: {sprite['width'] * scale:g}px {sprite['height'] * scale:g}px;}}"
+    )
+
+
+def sprite_icon_html(icon_path, size):
+    """
+    Element showing one icon from the atlas, or None when it is not in it.
+    Needs `sprite_css(size)` on the page.
+    """
+    sprite = load_sprite()
+    if sprite is None or not icon_path:
+        return None
+    position = sprite["icons"].get(Path(icon_path).stem)
+    if position is None:
+        return None
+    scale = size / sprite["px"]
+    x, y = (-coord * scale for coord in position)
+    return f'<span class="icon-sprite-{size}" style="background-position: {x:g}px {y:g}px"></span>'
+
+
+# ----------------------------------
+# REPORT
+# ----------------------------------
+def measure_pdf(grid, derived, repeats):
+    from src.utils.pdf_export import generate_pdf
+
+    generate_pdf(grid, "report", "Normal", derived_icons=derived)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        pdf = generate_pdf(grid, "report", "Normal", derived_icons=derived).getvalue()
+    return len(pdf), (time.perf_counter() - start) / repeats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build print and web icon derivatives and the web sprite")
+    parser.add_argument("--force", action="store_true", help="rebuild derivatives that are up to date")
+    parser.add_argument("--report", action="store_true", help="compare PDF size and render time with the originals")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    sizes = build_derivatives(force=args.force)
+    print(f"Built {len(sizes)} icons in {time.perf_counter() - start:.2f}s")
+
+    totals = [sum(column) for column in zip(*sizes.values())] if sizes else [0, 0, 0]
+    print(f"  original {totals[0] / 1024:8.1f} KB")
+    print(f"  pdf      {totals[1] / 1024:8.1f} KB  ({PDF_PX}px, {ICON_PDF_DPI} DPI)")
+    print(f"  web      {totals[2] / 1024:8.1f} KB  ({ICON_WEB_PX}px)")
+
+    sprite = build_sprite()
+    sprite_size = (SPRITE_DIR / sprite["image"]).stat().st_size
+    print(f"  sprite   {sprite_size / 1024:8.1f} KB  ({len(sprite['icons'])} icons, {sprite['image']})")
+
+    if args.report:
+        from src.utils.grid import grid_placer
+        from src.utils.data_loader import load_catalog
+        from src.utils.sampler import sampler
+
+        catalog = load_catalog()
+        factions = sorted(catalog.achievements.get("Faction", {}).keys())
+        grid = grid_placer(catalog, sampler(catalog, 2018, "Normal", ["General", "Faction"], factions))
+
+        for label, derived in (("original icons", False), ("derived icons", True)):
+            size, seconds = measure_pdf(grid, derived, args.repeats)
+            print(f"  PDF with {label:<15} {size / 1024:8.1f} KB  {seconds * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,356 @@
+# ----------------------------------
+# IMPORTS
+# ----------------------------------
+import argparse
+import io
+import threading
+import time
+from contextlib import contextmanager
+from reportlab import rl_config
+from reportlab.lib import colors
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.pdfgen import canvas
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Image, Spacer, Flowable, Frame
+from src.utils.icons import get_pdf_image
+from src.utils.sheet_layout import (
+    PAGE_SIZE,
+    MARGIN,
+    CELL_WIDTH,
+    CELL_HEIGHT,
+    ICON_SIZE,
+    TITLE_FONT,
+    NAME_FONT,
+    CONTENT_FONT,
+    TITLE_X,
+    TITLE_Y,
+    TABLE_TOP,
+    TABLE_LEFT,
+    TABLE_BOTTOM,
+    TABLE_RIGHT,
+    cell_origin,
+    layout_cell,
+    sheet_title,
+)
+from config.settings import PDF_RENDERER
+
+# ----------------------------------
+# CONSTANTS
+# ----------------------------------
+PDF_RENDERERS = ("platypus", "canvas")
+
+TABLE_STYLE = [
+    ("GRID", (0, 0), (-1, -1), 1, colors.black),
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+    ("LEFTPADDING", (0, 0), (-1, -1), 4),
+    ("RIGHTPADDING", (0, 0), (-1, -1), 4),
+    ("TOPPADDING", (0, 0), (-1, -1), 4),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+    ("BACKGROUND", (2, 2), (2, 2), colors.lightyellow),
+]
+
+# ----------------------------------
+# LAYOUT
+# ----------------------------------
+class IconFlowable(Flowable):
+    """
+    Draws a shared ImageReader, so each icon is decoded once per process.
+    """
+
+    def __init__(self, reader, width, height):
+        super().__init__()
+        self.reader = reader
+        self.width = width
+        self.height = height
+        self.hAlign = "CENTER"
+
+    def wrap(self, avail_width, avail_height):
+        return self.width, self.height
+
+    def draw(self):
+        self.canv.drawImage(self.reader, 0, 0, self.width, self.height)
+
+
+def pdf_styles():
+    styles = getSampleStyleSheet()
+
+    title_style = ParagraphStyle(
+        "TitleStyle",
+        parent=styles["Normal"],
+        fontSize=10,
+        alignment=1,
+        spaceAfter=5
+    )
+
+    name_style = ParagraphStyle(
+        "NameStyle",
+        parent=styles["Normal"],
+        fontSize=8,
+        alignment=1,
+        fontName="Helvetica-Bold",
+        leading=10
+    )
+
+    content_style = ParagraphStyle(
+        "ContentStyle",
+        parent=styles["Normal"],
+        fontSize=6,
+        alignment=1,
+        leading=8
+    )
+
+    return title_style, name_style, content_style
+
+
+def sheet_flowables(grid, seed_value, difficulty_text, styles, derived_icons=True):
+    """
+    Title and 5x5 table for one sheet.
+    """
+    title_style, name_style, content_style = styles
+    elements = []
+
+    title = Paragraph(f"Seed: {seed_value} | {difficulty_text}", title_style)
+    elements.append(title)
+    elements.append(Spacer(1, 0.1*inch))
+
+    table_data = []
+
+    for row in range(5):
+        row_data = []
+        for col in range(5):
+            cell = grid[row][col]
+            if cell:
+                cell_elements = []
+
+                icon_path = cell["icon"]
+                if icon_path:
+                    try:
+                        if derived_icons:
+                            img = IconFlowable(get_pdf_image(icon_path), ICON_SIZE, ICON_SIZE)
+                        else:
+                            img = Image(icon_path, width=ICON_SIZE, height=ICON_SIZE)
+                        cell_elements.append(img)
+                    except Exception:
+                        pass
+
+                name_text = cell["name"]
+                if cell.get("is_elite"):
+                    name_text = f"<u>{name_text}</u>"
+                name_para = Paragraph(name_text, name_style)
+                cell_elements.append(name_para)
+
+                content_para = Paragraph(cell["content"], content_style)
+                cell_elements.append(content_para)
+
+                row_data.append(cell_elements)
+            else:
+                row_data.append("")
+        table_data.append(row_data)
+
+    table = Table(
+        table_data,
+        colWidths=[CELL_WIDTH] * 5,
+        rowHeights=[CELL_HEIGHT] * 5
+    )
+    table.setStyle(TableStyle(TABLE_STYLE))
+
+    elements.append(table)
+    return elements
+
+
+# ----------------------------------
+# CANVAS RENDERER
+# ----------------------------------
+# The same page as the platypus layout above, with every position taken
+# from sheet_layout. Per sheet only the title, icons and wrapped text are
+# drawn.
+FRAME_FORM = "sheetFrame"
+
+
+def draw_frame(pdf):
+    """
+    Centre highlight and grid lines, stored as a form so a multi-sheet
+    document holds a single copy.
+    """
+    pdf.beginForm(FRAME_FORM)
+    pdf.setFillColor(colors.lightyellow)
+    pdf.rect(TABLE_LEFT + 2 * CELL_WIDTH, TABLE_TOP - 3 * CELL_HEIGHT, CELL_WIDTH, CELL_HEIGHT, stroke=0, fill=1)
+    pdf.setStrokeColor(colors.black)
+    pdf.setLineWidth(1)
+    for i in range(6):
+        x = TABLE_LEFT + i * CELL_WIDTH
+        y = TABLE_TOP - i * CELL_HEIGHT
+        pdf.line(x, TABLE_BOTTOM, x, TABLE_TOP)
+        pdf.line(TABLE_LEFT, y, TABLE_RIGHT, y)
+    pdf.endForm()
+
+
+def draw_text_lines(pdf, lines, font, center_x, top, underline=False):
+    font_name, font_size, leading = font
+    pdf.setFont(font_name, font_size)
+    baseline = top - font_size
+    for line, line_width, word_space in lines:
+        x = center_x - line_width / 2
+        pdf.drawString(x, baseline, line, wordSpace=word_space or None)
+        if underline:
+            pdf.line(x, baseline - 0.125 * font_size, x + line_width, baseline - 0.125 * font_size)
+        baseline -= leading
+
+
+def draw_cell(pdf, cell, left, top, derived_icons):
+    reader = None
+    if cell["icon"]:
+        try:
+            reader = get_pdf_image(cell["icon"], derived_icons)
+        except Exception:
+            reader = None
+
+    center_x, icon_top, name_top, name_lines, content_top, content_lines = layout_cell(cell, left, top, reader is not None)
+    if reader:
+        pdf.drawImage(reader, center_x - ICON_SIZE / 2, icon_top - ICON_SIZE, ICON_SIZE, ICON_SIZE)
+
+    draw_text_lines(pdf, name_lines, NAME_FONT, center_x, name_top, underline=cell.get("is_elite"))
+    draw_text_lines(pdf, content_lines, CONTENT_FONT, center_x, content_top)
+
+
+def draw_sheet(pdf, grid, seed_value, difficulty_text, derived_icons=True):
+    pdf.doForm(FRAME_FORM)
+    pdf.setFillColor(colors.black)
+    pdf.setFont(*TITLE_FONT)
+    pdf.drawCentredString(TITLE_X, TITLE_Y, sheet_title(seed_value, difficulty_text))
+
+    for row in range(5):
+        for col in range(5):
+            cell = grid[row][col]
+            if cell:
+                draw_cell(pdf, cell, *cell_origin(row, col), derived_icons)
+
+
+# ----------------------------------
+# STREAM ENCODING
+# ----------------------------------
+# Our documents store streams as binary instead of ASCII85 text. The
+# pure-Python encoder was most of the render time, and the files come out
+# ~20% smaller. reportlab only offers the process-wide rl_config.useA85, so
+# it is switched off while at least one of our documents renders and put
+# back when the last one finishes.
+_a85_lock = threading.Lock()
+_a85_state = {"renders": 0, "saved": None}
+
+
+@contextmanager
+def binary_streams():
+    with _a85_lock:
+        if _a85_state["renders"] == 0:
+            _a85_state["saved"] = rl_config.useA85
+            rl_config.useA85 = 0
+        _a85_state["renders"] += 1
+    try:
+        yield
+    finally:
+        with _a85_lock:
+            _a85_state["renders"] -= 1
+            if _a85_state["renders"] == 0:
+                rl_config.useA85 = _a85_state["saved"]
+
+
+# ----------------------------------
+# EXPORT
+# ----------------------------------
+def generate_pdf(grid, seed_value, difficulty_text, derived_icons=True, renderer=PDF_RENDERER):
+    with binary_streams():
+        return _generate_pdf(grid, seed_value, difficulty_text, derived_icons, renderer)
+
+
+def _generate_pdf(grid, seed_value, difficulty_text, derived_icons, renderer):
+    buffer = io.BytesIO()
+
+    if renderer == "canvas":
+        pdf = canvas.Canvas(buffer, pagesize=PAGE_SIZE, pageCompression=1)
+        draw_frame(pdf)
+        draw_sheet(pdf, grid, seed_value, difficulty_text, derived_icons)
+        pdf.showPage()
+        pdf.save()
+        buffer.seek(0)
+        return buffer
+
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=PAGE_SIZE,
+        leftMargin=MARGIN,
+        rightMargin=MARGIN,
+        topMargin=MARGIN,
+        bottomMargin=MARGIN
+    )
+
+    doc.build(sheet_flowables(grid, seed_value, difficulty_text, pdf_styles(), derived_icons))
+
+    buffer.seek(0)
+    return buffer
+
+
+def write_pdf_pack(sheets, output, renderer=PDF_RENDERER):
+    """
+    Write many sheets into one PDF, one landscape page each, with the same
+    layout as `generate_pdf`. `sheets` is an iterable of
+    (grid, seed_value, difficulty_text) consumed one page at a time, and
+    `output` a path or binary stream. Icons are embedded once and shared by
+    every page. Returns the page count.
+    """
+    with binary_streams():
+        return _write_pdf_pack(sheets, output, renderer)
+
+
+def _write_pdf_pack(sheets, output, renderer):
+    pdf = canvas.Canvas(output, pagesize=PAGE_SIZE, pageCompression=1)
+    styles = pdf_styles()
+    width, height = PAGE_SIZE
+    pages = 0
+
+    if renderer == "canvas":
+        draw_frame(pdf)
+
+    for grid, seed_value, difficulty_text in sheets:
+        if renderer == "canvas":
+            draw_sheet(pdf, grid, seed_value, difficulty_text)
+        else:
+            frame = Frame(MARGIN, MARGIN, width - 2 * MARGIN, height - 2 * MARGIN)
+            frame.addFromList(sheet_flowables(grid, seed_value, difficulty_text, styles), pdf)
+        pdf.showPage()
+        pages += 1
+
+    pdf.save()
+    return pages
+
+
+# ----------------------------------
+# MAIN
+# ----------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-sheet render time of the PDF renderers")
+    parser.add_argument("--sheets", type=int, default=100)
+    args = parser.parse_args()
+
+    from src.utils.data_loader import load_catalog
+    from src.utils.grid import grid_placer
+    from src.utils.sampler import sampler
+
+    catalog = load_catalog()
+    factions = sorted(catalog.achievements.get("Faction", {}).keys())
+    grids = [
+        grid_placer(catalog, sampler(catalog, seed, "Mixed", ["General", "Faction"], factions))
+        for seed in range(args.sheets)
+    ]
+
+    for renderer in PDF_RENDERERS:
+        generate_pdf(grids[0], 0, "Mixed", renderer=renderer)
+        start = time.perf_counter()
+        for seed, grid in enumerate(grids):
+            size = len(generate_pdf(grid, seed, "Mixed", renderer=renderer).getvalue())
+        per_sheet = (time.perf_counter() - start) / len(grids)
+        print(f"{renderer:<9} {per_sheet * 1000:6.2f} ms/sheet  {size / 1024:6.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+# ----------------------------------
+# IMPORTS
+# ----------------------------------
+import threading
+from config.settings import BINGO_GRID_SIZE
+
+# ----------------------------------
+# CONSTANTS
+# ----------------------------------
+# Cell (row, col) of the grid_placer grid is bit row * 5 + col.
+CENTER = BINGO_GRID_SIZE // 2
+CENTER_BIT = 1 << (CENTER * BINGO_GRID_SIZE + CENTER)
+FULL_MASK = (1 << (BINGO_GRID_SIZE * BINGO_GRID_SIZE)) - 1
+
+
+def cell_bit(row, col):
+    return 1 << (row * BINGO_GRID_SIZE + col)
+
+
+def _line_mask(cells):
+    mask = 0
+    for row, col in cells:
+        mask |= cell_bit(row, col)
+    return mask
+
+
+_SIZE = range(BINGO_GRID_SIZE)
+LINE_MASKS = tuple(
+    [_line_mask((row, col) for col in _SIZE) for row in _SIZE]
+    + [_line_mask((row, col) for row in _SIZE) for col in _SIZE]
+    + [_line_mask((i, i) for i in _SIZE), _line_mask((i, BINGO_GRID_SIZE - 1 - i) for i in _SIZE)]
+)
+
+# ----------------------------------
+# MASK QUERIES
+# ----------------------------------
+def normalize_marks(marks):
+    # The centre Bingo cell counts as marked for every player.
+    return (marks | CENTER_BIT) & FULL_MASK
+
+
+def completed_lines(marks):
+    return sum(1 for line in LINE_MASKS if marks & line == line)
+
+
+def has_bingo(marks):
+    for line in LINE_MASKS:
+        if marks & line == line:
+            return True
+    return False
+
+
+def cells_to_bingo(marks):
+    return min((line & ~marks).bit_count() for line in LINE_MASKS)
+
+
+def cell_ids(grid):
+    """
+    Map achievement ID -> cell bit for a grid_placer grid.
+    """
+    ids = {}
+    for row, cells in enumerate(grid):
+        for col, cell in enumerate(cells):
+            if cell and cell.get("id") is not None:
+                ids[cell["id"]] = cell_bit(row, col)
+    return ids
+
+
+# ----------------------------------
+# STORE
+# ----------------------------------
+class Game:
+    __slots__ = ("cells", "marks", "winners")
+
+    def __init__(self, cells):
+        self.cells = cells
+        self.marks = {}
+        # dict for ordered, O(1) membership
+        self.winners = {}
+
+
+class ProgressStore:
+    """
+    In-memory play state: one 25-bit mark mask per player per game. Winners
+    are recorded in the order they first complete a line, so "who has bingo"
+    is a lookup and standings need 12 ANDs per player.
+    """
+
+    def __init__(self):
+        self._games = {}
+        self._lock = threading.Lock()
+
+    def create_game(self, game_id, grid=None):
+        with self._lock:
+            game = self._games.get(game_id)
+            if game is None:
+                game = Game(cell_ids(grid) if grid is not None else {})
+                self._games[game_id] = game
+            return game
+
+    def remove_game(self, game_id):
+        with self._lock:
+            self._games.pop(game_id, None)
+
+    def _update(self, game_id, player, change):
+        with self._lock:
+            game = self._games[game_id]
+            marks = normalize_marks(change(game.marks.get(player, 0)))
+            game.marks[player] = marks
+            if has_bingo(marks):
+                game.winners.setdefault(player, None)
+            else:
+                game.winners.pop(player, None)
+            return marks
+
+    def join(self, game_id, player):
+        return self._update(game_id, player, lambda marks: marks)
+
+    def set_marks(self, game_id, player, marks):
+        return self._update(game_id, player, lambda _marks: marks)
+
+    def mark(self, game_id, player, row, col):
+        bit = cell_bit(row, col)
+        return self._update(game_id, player, lambda marks: marks | bit)
+
+    def unmark(self, game_id, player, row, col):
+        bit = cell_bit(row, col)
+        if bit == CENTER_BIT:
+            return self.join(game_id, player)
+        return self._update(game_id, player, lambda marks: marks & ~bit)
+
+    def mark_achievement(self, game_id, player, achievement_id):
+        with self._lock:
+            bit = self._games[game_id].cells[achievement_id]
+        return self._update(game_id, player, lambda marks: marks | bit)
+
+    def marks(self, game_id, player):
+        with self._lock:
+            return self._games[game_id].marks.get(player, CENTER_BIT)
+
+    def winners(self, game_id):
+        with self._lock:
+            game = self._games.get(game_id)
+            return list(game.winners) if game else []
+
+    def standings(self, game_id):
+        """
+        (player, cells still needed for a line, completed lines), closest
+        to bingo first.
+        """
+        with self._lock:
+            game = self._games.get(game_id)
+            if game is None:
+                return []
+            items = list(game.marks.items())
+        rows = [(player, cells_to_bingo(marks), completed_lines(marks)) for player, marks in items]
+        rows.sort(key=lambda row: (row[1], -row[2]))
+        return rows
+
+    def stats(self):
+        with self._lock:
+            return {
+                "games": len(self._games),
+                "players": sum(len(game.marks) for game in self._games.values()),
+            }
+
@@ -0,0 +1,541 @@
+# ----------------------------------
+# IMPORTS
+# ----------------------------------
+import random
+from config.settings import SAMPLER_MODE
+from src.utils.seeds import derive_seed
+
+# ----------------------------------
+# CONSTANTS
+# ----------------------------------
+GENERAL_CATEGORIES = ["Gameplay", "Map", "Landmarks", "Bingo"]
+SHEET_CELLS = 24
+SAMPLER_MODES = ("compat", "fast")
+
+# ----------------------------------
+# POOL
+# ----------------------------------
+class Bucket:
+    """
+    One sampling bucket ("General" or "Faction-<X>") as record indices.
+    `items` is the bucket in catalog order for the requested difficulty;
+    `normal`, `elite` and `both` are the same items partitioned by mode.
+    """
+
+    __slots__ = ("items", "normal", "elite", "both")
+
+    def __init__(self):
+        self.items = []
+        self.normal = []
+        self.elite = []
+        self.both = []
+
+    def extend(self, group, difficulty_code):
+        self.items.extend(group.by_difficulty[difficulty_code])
+        if difficulty_code != "e":
+            self.normal.extend(group.by_mode["Normal"])
+        if difficulty_code != "n":
+            self.elite.extend(group.by_mode["Elite"])
+        self.both.extend(group.by_mode["Both"])
+
+
+def get_bingo_achievement_id(achievements, difficulty):
+    bingo_data = achievements.get("General", {}).get("Bingo", {})
+    mode_to_find = "Normal" if difficulty == "n" else "Elite"
+
+    for achievement_id, achievement in bingo_data.items():
+        if achievement.get("mode") == mode_to_find:
+            return achievement_id
+
+    return None
+
+
+def get_bucket_key(cat1, cat2):
+    if cat1 == "General":
+        return "General"
+    else:
+        return f"Faction-{cat2}"
+
+
+def iter_selected_groups(catalog, selected_cat1, selected_faction_cat2, difficulty):
+    """
+    Yield (bucket key, category group) for every non-empty group a selection
+    draws from, in the order buckets are first seen by the sampler.
+    """
+    for cat1 in selected_cat1:
+        if cat1 not in catalog.achievements:
+            continue
+
+        if cat1 == "General":
+            categories_to_use = [c for c in GENERAL_CATEGORIES if c != "Bingo"]
+        else:
+            categories_to_use = selected_faction_cat2
+
+        for cat2 in categories_to_use:
+            group = catalog.groups.get((cat1, cat2))
+            if group is None or not group.by_difficulty[difficulty]:
+                continue
+
+            yield get_bucket_key(cat1, cat2), group
+
+
+def build_buckets(catalog, selected_cat1, selected_faction_cat2, difficulty):
+    """
+    Assemble the sampling buckets for a selection from the catalog's
+    precomputed category groups. Bucket order and item order match a walk
+    of the catalog, so seeded results are unchanged.
+    """
+    buckets = {}
+
+    for key, group in iter_selected_groups(catalog, selected_cat1, selected_faction_cat2, difficulty):
+        if key not in buckets:
+            buckets[key] = Bucket()
+        buckets[key].extend(group, difficulty)
+
+    return buckets
+
+
+# ----------------------------------
+# SAMPLING (COMPAT)
+# ----------------------------------
+# The original engine. Kept call-for-call identical so existing seeds keep
+# producing the same sheets; it copies and fully shuffles every bucket.
+def mixed_sample_from_bucket(records, bucket, count, rng):
+    """
+    Sample from a bucket for mixed mode.
+    First half draws from Normal + Both (Both items get normal difficulty).
+    Second half draws from Elite + Both (Both items get elite difficulty).
+    Items from Both can only be drawn once (no replacement across phases).
+    Returns list of (index, is_elite) tuples.
+    """
+    if count <= 0:
+        return []
+
+    normal_count = (count + 1) // 2
+    elite_count = count - normal_count
+
+    normal_items = list(bucket.normal)
+    elite_items = list(bucket.elite)
+    both_items = list(bucket.both)
+
+    rng.shuffle(normal_items)
+    rng.shuffle(elite_items)
+    rng.shuffle(both_items)
+
+    result = []
+    used_both = set()
+
+    normal_pool = normal_items + both_items
+    rng.shuffle(normal_pool)
+
+    drawn_normal = 0
+    for index in normal_pool:
+        if drawn_normal >= normal_count:
+            break
+        if records[index].mode == "Both":
+            if index not in used_both:
+                result.append((index, False))
+                used_both.add(index)
+                drawn_normal += 1
+        else:
+            result.append((index, False))
+            drawn_normal += 1
+
+    elite_pool = elite_items + [index for index in both_items if index not in used_both]
+    rng.shuffle(elite_pool)
+
+    drawn_elite = 0
+    for index in elite_pool:
+        if drawn_elite >= elite_count:
+            break
+        if records[index].mode == "Both":
+            if index not in used_both:
+                result.append((index, True))
+                used_both.add(index)
+                drawn_elite += 1
+        else:
+            result.append((index, True))
+            drawn_elite += 1
+
+    return result
+
+
+def sample_from_buckets_mixed(records, buckets, total_needed, rng):
+    """
+    Sample from buckets for mixed mode.
+    Returns list of (index, is_elite) tuples.
+    """
+    if not buckets:
+        return []
+
+    num_buckets = len(buckets)
+    base_per_bucket = total_needed // num_buckets
+    remainder = total_needed % num_buckets
+
+    sampled = []
+    sampled_indices = set()
+
+    bucket_names = list(buckets.keys())
+    rng.shuffle(bucket_names)
+
+    remaining_items = []
+
+    for i, bucket_name in enumerate(bucket_names):
+        bucket = buckets[bucket_name]
+        count = base_per_bucket + (1 if i < remainder else 0)
+
+        bucket_result = mixed_sample_from_bucket(records, bucket, count, rng)
+
+        for index, is_elite in bucket_result:
+            if index not in sampled_indices:
+                sampled.append((index, is_elite))
+                sampled_indices.add(index)
+
+        used_in_bucket = {index for index, _ in bucket_result}
+        leftover = [index for index in bucket.items if index not in used_in_bucket]
+        remaining_items.extend(leftover)
+
+    rng.shuffle(remaining_items)
+    for index in remaining_items:
+        if len(sampled) >= total_needed:
+            break
+        if index not in sampled_indices:
+            is_elite = records[index].mode == "Elite"
+            sampled.append((index, is_elite))
+            sampled_indices.add(index)
+
+    return sampled
+
+
+def sample_from_buckets(buckets, total_needed, rng):
+    if not buckets:
+        return []
+
+    num_buckets = len(buckets)
+    base_per_bucket = total_needed // num_buckets
+    remainder = total_needed % num_buckets
+
+    sampled = []
+    sampled_indices = set()
+
+    bucket_names = list(buckets.keys())
+    rng.shuffle(bucket_names)
+
+    remaining_buckets = {}
+
+    for i, bucket_name in enumerate(bucket_names):
+        bucket = list(buckets[bucket_name].items)
+        rng.shuffle(bucket)
+
+        count = base_per_bucket + (1 if i < remainder else 0)
+        count = min(count, len(bucket))
+
+        for index in bucket[:count]:
+            sampled.append(index)
+            sampled_indices.add(index)
+
+        leftover = [index for index in bucket[count:] if index not in sampled_indices]
+        if leftover:
+            remaining_buckets[bucket_name] = leftover
+
+    while len(sampled) < total_needed and remaining_buckets:
+        available_bucket_names = list(remaining_buckets.keys())
+        chosen_bucket_name = rng.choice(available_bucket_names)
+        chosen_bucket = remaining_buckets[chosen_bucket_name]
+
+        if chosen_bucket:
+            index = chosen_bucket.pop(0)
+            sampled.append(index)
+            sampled_indices.add(index)
+
+        if not chosen_bucket:
+            del remaining_buckets[chosen_bucket_name]
+
+    return sampled
+
+
+# ----------------------------------
+# SAMPLING (FAST)
+# ----------------------------------
+# Same distributions as the compat engine, but each bucket is sampled with a
+# partial Fisher-Yates over its index tuple: only the positions actually
+# drawn are touched, tracked in a small swap dict instead of a shuffled copy.
+def draw_position(rng, n, i, swaps):
+    """
+    Step i of a virtual Fisher-Yates shuffle of range(n): return the
+    position that lands in slot i. `swaps` holds the displaced positions.
+    """
+    j = i + rng.randrange(n - i)
+    position = swaps.get(j, j)
+    swaps[j] = swaps.get(i, i)
+    return position
+
+
+def item_at(parts, position):
+    for part in parts:
+        if position < len(part):
+            return part[position]
+        position -= len(part)
+    raise IndexError(position)
+
+
+def fast_sample_from_buckets(buckets, total_needed, rng):
+    if not buckets:
+        return []
+
+    bucket_list = list(buckets.values())
+    num_buckets = len(bucket_list)
+    base_per_bucket, remainder = divmod(total_needed, num_buckets)
+
+    bonus = set()
+    bonus_swaps = {}
+    for i in range(remainder):
+        bonus.add(draw_position(rng, num_buckets, i, bonus_swaps))
+
+    sampled = []
+    open_buckets = []
+
+    for b, bucket in enumerate(bucket_list):
+        items = bucket.items
+        n = len(items)
+        count = min(base_per_bucket + (1 if b in bonus else 0), n)
+
+        swaps = {}
+        for i in range(count):
+            sampled.append(items[draw_position(rng, n, i, swaps)])
+
+        if count < n:
+            open_buckets.append([items, count, swaps])
+
+    while len(sampled) < total_needed and open_buckets:
+        k = rng.randrange(len(open_buckets))
+        state = open_buckets[k]
+        items, i, swaps = state
+
+        sampled.append(items[draw_position(rng, len(items), i, swaps)])
+        state[1] = i + 1
+
+        if state[1] == len(items):
+            open_buckets[k] = open_buckets[-1]
+            open_buckets.pop()
+
+    return sampled
+
+
+def fast_mixed_sample_from_bucket(bucket, count, rng, used, sampled):
+    """
+    Mixed-mode draw for one bucket, appending (index, is_elite) to `sampled`.
+    Normal half from Normal + Both, elite half from Elite + unused Both.
+    """
+    if count <= 0:
+        return
+
+    normal_count = (count + 1) // 2
+    elite_count = count - normal_count
+
+    parts = (bucket.normal, bucket.both)
+    n = len(bucket.normal) + len(bucket.both)
+    swaps = {}
+    for i in range(min(normal_count, n)):
+        index = item_at(parts, draw_position(rng, n, i, swaps))
+        sampled.append((index, False))
+        used.add(index)
+
+    parts = (bucket.elite, bucket.both)
+    n = len(bucket.elite) + len(bucket.both)
+    swaps = {}
+    drawn = 0
+    i = 0
+    while drawn < elite_count and i < n:
+        index = item_at(parts, draw_position(rng, n, i, swaps))
+        i += 1
+        if index in used:
+            continue
+        sampled.append((index, True))
+        used.add(index)
+        drawn += 1
+
+
+def fast_sample_from_buckets_mixed(records, buckets, total_needed, rng):
+    if not buckets:
+        return []
+
+    bucket_list = list(buckets.values())
+    num_buckets = len(bucket_list)
+    base_per_bucket, remainder = divmod(total_needed, num_buckets)
+
+    bonus = set()
+    bonus_swaps = {}
+    for i in range(remainder):
+        bonus.add(draw_position(rng, num_buckets, i, bonus_swaps))
+
+    sampled = []
+    used = set()
+
+    for b, bucket in enumerate(bucket_list):
+        count = base_per_bucket + (1 if b in bonus else 0)
+        fast_mixed_sample_from_bucket(bucket, count, rng, used, sampled)
+
+    parts = [bucket.items for bucket in bucket_list]
+    n = sum(len(part) for part in parts)
+    swaps = {}
+    i = 0
+    while len(sampled) < total_needed and i < n:
+        index = item_at(parts, draw_position(rng, n, i, swaps))
+        i += 1
+        if index in used:
+            continue
+        sampled.append((index, records[index].mode == "Elite"))
+        used.add(index)
+
+    return sampled
+
+
+# ----------------------------------
+# SHEETS
+# ----------------------------------
+def get_difficulty_code(difficulty):
+    if difficulty == "Normal":
+        return "n"
+    elif difficulty == "Mixed":
+        return "m"
+    else:
+        return "e"
+
+
+class SamplingPlan:
+    """
+    Everything about a sheet request that does not depend on the seed:
+    resolved difficulty, the centre Bingo achievement and the buckets.
+    Build once with prepare_plan() and reuse it for any number of seeds.
+    """
+
+    __slots__ = ("difficulty_code", "bingo_id", "buckets", "mode")
+
+    def __init__(self, difficulty_code, bingo_id, buckets, mode):
+        if mode not in SAMPLER_MODES:
+            raise ValueError(f"Unknown sampler mode {mode!r}")
+        self.difficulty_code = difficulty_code
+        self.bingo_id = bingo_id
+        self.buckets = buckets
+        self.mode = mode
+
+
+def prepare_plan(catalog, difficulty, selected_cat1, selected_faction_cat2, mode=SAMPLER_MODE):
+    difficulty_code = get_difficulty_code(difficulty)
+
+    bingo_difficulty_code = "n" if difficulty == "Normal" else "e"
+    bingo_id = get_bingo_achievement_id(catalog.achievements, bingo_difficulty_code)
+    if bingo_id is None:
+        return None
+
+    buckets = build_buckets(catalog, selected_cat1, selected_faction_cat2, difficulty_code)
+    return SamplingPlan(difficulty_code, bingo_id, buckets, mode)
+
+
+def sample_indices(records, plan, seed_int):
+    """
+    Draw one sheet for `plan` as (index, is_elite) pairs in sheet order,
+    excluding the centre Bingo cell.
+    """
+    rng = random.Random(seed_int)
+    fast = plan.mode == "fast"
+
+    if plan.difficulty_code == "m":
+        if fast:
+            sampled_with_elite = fast_sample_from_buckets_mixed(records, plan.buckets, SHEET_CELLS, rng)
+        else:
+            sampled_with_elite = sample_from_buckets_mixed(records, plan.buckets, SHEET_CELLS, rng)
+        rng.shuffle(sampled_with_elite)
+        return sampled_with_elite
+
+    if fast:
+        sampled_indices = fast_sample_from_buckets(plan.buckets, SHEET_CELLS, rng)
+    else:
+        sampled_indices = sample_from_buckets(plan.buckets, SHEET_CELLS, rng)
+    rng.shuffle(sampled_indices)
+
+    is_elite = plan.difficulty_code == "e"
+    return [(index, is_elite or records[index].mode == "Elite") for index in sampled_indices]
+
+
+def sampler(catalog, seed, difficulty, selected_cat1, selected_faction_cat2, mode=SAMPLER_MODE):
+    plan = prepare_plan(catalog, difficulty, selected_cat1, selected_faction_cat2, mode)
+    if plan is None:
+        return None
+
+    bingo_is_elite = plan.difficulty_code != "n"
+    records = catalog.records
+
+    result = [plan.difficulty_code, (plan.bingo_id, bingo_is_elite)]
+    for index, is_elite in sample_indices(records, plan, derive_seed(seed)):
+        result.append((records[index].id, is_elite))
+
+    return result
+
+
+# ----------------------------------
+# FEASIBILITY
+# ----------------------------------
+class Feasibility:
+    """
+    Whether a selection can fill a sheet, computed from per-group counts only.
+    `fillable` counts the sampled cells (the centre Bingo cell is extra);
+    `underrepresented` lists buckets that cannot always supply their fair
+    share of cells, with their item counts.
+    """
+
+    __slots__ = ("feasible", "fillable", "needed", "has_bingo", "bucket_sizes", "underrepresented")
+
+    def __init__(self, fillable, has_bingo, bucket_sizes, underrepresented):
+        self.needed = SHEET_CELLS
+        self.fillable = fillable
+        self.has_bingo = has_bingo
+        self.feasible = has_bingo and fillable >= SHEET_CELLS
+        self.bucket_sizes = bucket_sizes
+        self.underrepresented = underrepresented
+
+
+def mixed_bucket_capacity(counts, quota):
+    """
+    Cells a bucket is guaranteed to supply in mixed mode for `quota`: the
+    normal half draws from Normal + Both, the elite half from Elite plus the
+    Both items the normal half (at worst) left behind.
+    """
+    normal, elite, both = counts
+    normal_quota = (quota + 1) // 2
+    normal_drawn = min(normal_quota, normal + both)
+    both_left = both - min(both, normal_drawn)
+    return normal_drawn + min(quota - normal_quota, elite + both_left)
+
+
+def check_feasibility(catalog, difficulty, selected_cat1, selected_faction_cat2):
+    difficulty_code = get_difficulty_code(difficulty)
+
+    bingo_difficulty_code = "n" if difficulty == "Normal" else "e"
+    has_bingo = get_bingo_achievement_id(catalog.achievements, bingo_difficulty_code) is not None
+
+    sizes = {}
+    mode_counts = {}
+    for key, group in iter_selected_groups(catalog, selected_cat1, selected_faction_cat2, difficulty_code):
+        sizes[key] = sizes.get(key, 0) + len(group.by_difficulty[difficulty_code])
+        normal, elite, both = mode_counts.get(key, (0, 0, 0))
+        mode_counts[key] = (
+            normal + len(group.by_mode["Normal"]),
+            elite + len(group.by_mode["Elite"]),
+            both + len(group.by_mode["Both"]),
+        )
+
+    underrepresented = {}
+    if sizes:
+        quota = -(-SHEET_CELLS // len(sizes))
+        for key, size in sizes.items():
+            if difficulty_code == "m":
+                capacity = mixed_bucket_capacity(mode_counts[key], quota)
+            else:
+                capacity = min(size, quota)
+            if capacity < quota:
+                underrepresented[key] = size
+
+    fillable = min(SHEET_CELLS, sum(sizes.values()))
+    return Feasibility(fillable, has_bingo, sizes, underrepresented)
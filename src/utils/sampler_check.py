@@ -0,0 +1,214 @@
+# ----------------------------------
+# IMPORTS
+# ----------------------------------
+import argparse
+import hashlib
+import json
+import math
+import sys
+from collections import Counter
+from config.settings import DATA_DIR
+from src.utils.data_loader import load_catalog
+from src.utils.sampler import SHEET_CELLS, prepare_plan, sample_indices, sampler
+
+# ----------------------------------
+# CONSTANTS
+# ----------------------------------
+GOLDEN_PATH = DATA_DIR / "sampler_golden.json"
+GOLDEN_SEEDS = 200
+STAT_SEEDS = 20000
+MAX_Z = 5.0
+DIFFICULTIES = ["Normal", "Mixed", "Hard"]
+
+# ----------------------------------
+# CONFIGS
+# ----------------------------------
+def check_configs(catalog):
+    factions = sorted(catalog.achievements.get("Faction", {}).keys())
+    selections = [
+        (["General", "Faction"], factions),
+        (["General"], []),
+        (["General", "Faction"], factions[:2]),
+        (["General", "Faction"], factions[:1]),
+        # Selections in click order, not sorted: their buckets (and sheets)
+        # follow the order given.
+        (["Faction", "General"], factions[::-1]),
+        (["Faction", "General"], factions[2:0:-1]),
+    ]
+    return [
+        (difficulty, cat1, faction_cat2)
+        for difficulty in DIFFICULTIES
+        for cat1, faction_cat2 in selections
+    ]
+
+
+# ----------------------------------
+# GOLDEN OUTPUTS
+# ----------------------------------
+def golden_digest(catalog, difficulty, cat1, faction_cat2, seeds):
+    outputs = [sampler(catalog, seed, difficulty, cat1, faction_cat2, mode="compat") for seed in seeds]
+    return hashlib.sha256(json.dumps(outputs).encode("utf-8")).hexdigest()
+
+
+def write_golden(catalog):
+    configs = [
+        {
+            "difficulty": difficulty,
+            "cat1": cat1,
+            "factions": faction_cat2,
+            "digest": golden_digest(catalog, difficulty, cat1, faction_cat2, range(GOLDEN_SEEDS)),
+        }
+        for difficulty, cat1, faction_cat2 in check_configs(catalog)
+    ]
+    golden = {"catalog_version": catalog.version, "seeds": GOLDEN_SEEDS, "configs": configs}
+    with open(GOLDEN_PATH, "w", encoding="utf-8") as f:
+        json.dump(golden, f, indent=4)
+
+
+def check_golden(catalog):
+    """
+    Compat mode must reproduce the recorded sheets exactly. The recording is
+    tied to one catalog version, and a recording for another version fails
+    the check: regenerate it with --update-golden after a deliberate catalog
+    change.
+    """
+    if not GOLDEN_PATH.exists():
+        return [f"{GOLDEN_PATH.name} missing"]
+
+    with open(GOLDEN_PATH, "r", encoding="utf-8") as f:
+        golden = json.load(f)
+
+    if golden["catalog_version"] != catalog.version:
+        return [
+            f"{GOLDEN_PATH.name} was recorded for catalog {golden['catalog_version'][:12]}, "
+            f"not {catalog.version[:12]}; run --update-golden if the catalog change is deliberate"
+        ]
+
+    failures = []
+    for config in golden["configs"]:
+        digest = golden_digest(catalog, config["difficulty"], config["cat1"], config["factions"], range(golden["seeds"]))
+        if digest != config["digest"]:
+            failures.append(f"compat output changed for {config['difficulty']} {config['cat1']} {config['factions']}")
+    return failures
+
+
+# ----------------------------------
+# FAST MODE INVARIANTS
+# ----------------------------------
+def simulate(catalog, plan, seeds):
+    records = catalog.records
+    bucket_of = {index: name for name, bucket in plan.buckets.items() for index in bucket.items}
+
+    inclusion = Counter()
+    elite = Counter()
+    bucket_cells = Counter()
+    sheets = []
+
+    for seed in seeds:
+        sheet = sample_indices(records, plan, seed)
+        sheets.append(sheet)
+        for index, is_elite in sheet:
+            inclusion[index] += 1
+            elite[index] += is_elite
+            bucket_cells[bucket_of[index]] += 1
+
+    return sheets, inclusion, elite, bucket_cells
+
+
+def check_invariants(plan, sheets):
+    failures = []
+    pool_size = sum(len(bucket.items) for bucket in plan.buckets.values())
+    expected_cells = min(SHEET_CELLS, pool_size)
+    base_per_bucket = SHEET_CELLS // len(plan.buckets) if plan.buckets else 0
+
+    for sheet in sheets:
+        indices = [index for index, _ in sheet]
+        if len(indices) != expected_cells:
+            failures.append(f"sheet has {len(indices)} cells, expected {expected_cells}")
+        if len(set(indices)) != len(indices):
+            failures.append("sheet repeats an achievement")
+
+        per_bucket = Counter()
+        for name, bucket in plan.buckets.items():
+            members = set(bucket.items)
+            per_bucket[name] = sum(1 for index in indices if index in members)
+            if per_bucket[name] < min(base_per_bucket, len(bucket.items)) and plan.difficulty_code != "m":
+                failures.append(f"bucket {name} under its guaranteed share")
+
+        if failures:
+            break
+
+    return failures
+
+
+def compare_rates(label, compat, fast, trials):
+    """
+    Two-sample z-test on rates: flag keys whose compat and fast frequencies
+    differ by more than MAX_Z standard errors.
+    """
+    failures = []
+    for key in set(compat) | set(fast):
+        p_compat = compat[key] / trials
+        p_fast = fast[key] / trials
+        p = (compat[key] + fast[key]) / (2 * trials)
+        stderr = math.sqrt(max(p * (1 - p), 1e-12) * 2 / trials)
+        z = abs(p_compat - p_fast) / stderr
+        if z > MAX_Z:
+            failures.append(f"{label} {key}: compat {p_compat:.4f} vs fast {p_fast:.4f} (z={z:.1f})")
+    return failures
+
+
+def check_balance(catalog, difficulty, cat1, faction_cat2, trials=STAT_SEEDS):
+    seeds = range(trials)
+    compat_plan = prepare_plan(catalog, difficulty, cat1, faction_cat2, mode="compat")
+    fast_plan = prepare_plan(catalog, difficulty, cat1, faction_cat2, mode="fast")
+    if compat_plan is None:
+        return []
+
+    _, compat_inclusion, compat_elite, compat_buckets = simulate(catalog, compat_plan, seeds)
+    fast_sheets, fast_inclusion, fast_elite, fast_buckets = simulate(catalog, fast_plan, seeds)
+
+    # Bucket cell counts can exceed one per sheet, so compare them as rates
+    # over all cells instead of over sheets.
+    cells = trials * SHEET_CELLS
+    failures = check_invariants(fast_plan, fast_sheets)
+    failures += compare_rates("bucket", compat_buckets, fast_buckets, cells)
+    failures += compare_rates("item", compat_inclusion, fast_inclusion, trials)
+    failures += compare_rates("elite", compat_elite, fast_elite, trials)
+    return failures
+
+
+# ----------------------------------
+# MAIN
+# ----------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Check the sampler against recorded outputs and its fast mode")
+    parser.add_argument("--update-golden", action="store_true", help="record compat outputs for this catalog")
+    parser.add_argument("--trials", type=int, default=STAT_SEEDS, help="seeds per configuration for the balance test")
+    args = parser.parse_args()
+
+    catalog = load_catalog()
+
+    if args.update_golden:
+        write_golden(catalog)
+        print(f"Recorded {GOLDEN_PATH}")
+        return
+
+    failures = []
+
+    print("compat: exact outputs")
+    failures += check_golden(catalog)
+
+    for difficulty, cat1, faction_cat2 in check_configs(catalog):
+        print(f"fast: balance {difficulty} {cat1} {faction_cat2}")
+        failures += check_balance(catalog, difficulty, cat1, faction_cat2, args.trials)
+
+    for failure in failures:
+        print(f"  FAIL {failure}")
+
+    print("OK" if not failures else f"{len(failures)} failure(s)")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+# ----------------------------------
+# IMPORTS
+# ----------------------------------
+import argparse
+import bisect
+import math
+import re
+import time
+from src.utils.formatting import fill_template
+
+# ----------------------------------
+# CONSTANTS
+# ----------------------------------
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# Weight of a hit in each field. Rule text is indexed with both the normal
+# and the elite value filled in, so "Sawmill" or "5" match either variant.
+FIELD_WEIGHTS = {
+    "name": 3.0,
+    "base": 1.0,
+    "window": 0.5,
+    "notes": 0.5,
+}
+PREFIX_WEIGHT = 0.5
+
+# ----------------------------------
+# FUNCTIONS
+# ----------------------------------
+def tokenize(text):
+    return TOKEN_PATTERN.findall(str(text).lower()) if text else []
+
+
+def record_fields(record):
+    data = record.data
+    base = data.get("base")
+    return {
+        "name": record.name,
+        "base": f"{fill_template(base, data.get('normal'))} {fill_template(base, data.get('elite'))}",
+        "window": data.get("window"),
+        "notes": record.notes,
+    }
+
+
+def parse_query(query):
+    """
+    Returns [(token, is_prefix)]. A trailing `*` makes a token a prefix, and
+    so does the last one when the query does not end in a space, so results
+    narrow while a word is still being typed.
+    """
+    terms = []
+    for raw in str(query).lower().split():
+        prefix = raw.endswith("*")
+        for token in TOKEN_PATTERN.findall(raw):
+            terms.append([token, False])
+        if prefix and terms:
+            terms[-1][1] = True
+    if terms and query and not query[-1].isspace():
+        terms[-1][1] = True
+    return [tuple(term) for term in terms]
+
+
+# ----------------------------------
+# INDEX
+# ----------------------------------
+class SearchIndex:
+    """
+    Inverted index over the name, rule text, window and notes of every
+    record. Postings map a token to {record index: field-weighted count},
+    and a sorted vocabulary answers prefix lookups by bisection.
+    """
+
+    __slots__ = ("postings", "vocabulary", "idf")
+
+    def __init__(self, records):
+        self.postings = {}
+        for record in records:
+            for field, text in record_fields(record).items():
+                weight = FIELD_WEIGHTS[field]
+                for token in tokenize(text):
+                    posting = self.postings.setdefault(token, {})
+                    posting[record.index] = posting.get(record.index, 0.0) + weight
+
+        self.vocabulary = sorted(self.postings)
+        total = max(len(records), 1)
+        self.idf = {
+            token: math.log(1 + total / len(posting))
+            for token, posting in self.postings.items()
+        }
+
+    def expand(self, prefix):
+        start = bisect.bisect_left(self.vocabulary, prefix)
+        stop = bisect.bisect_left(self.vocabulary, prefix + "\uffff", start)
+        return self.vocabulary[start:stop]
+
+    def term_scores(self, token, is_prefix):
+        """
+        {record index: score} for one query term. Prefix expansions score
+        below an exact match of the same token.
+        """
+        scores = {}
+        for match in (self.expand(token) if is_prefix else (token,)):
+            posting = self.postings.get(match)
+            if not posting:
+                continue
+            weight = self.idf[match] * (1.0 if match == token else PREFIX_WEIGHT)
+            for index, count in posting.items():
+                score = count * weight
+                if score > scores.get(index, 0.0):
+                    scores[index] = score
+        return scores
+
+    def search(self, query, limit=None):
+        """
+        Record indices matching every term of `query`, best first, ties in
+        catalog order. Returns [(index, score)].
+        """
+        terms = parse_query(query)
+        if not terms:
+            return []
+
+        totals = None
+        for token, is_prefix in terms:
+            scores = self.term_scores(token, is_prefix)
+            if totals is None:
+                totals = scores
+            else:
+                totals = {index: totals[index] + score for index, score in scores.items() if index in totals}
+            if not totals:
+                return []
+
+        results = sorted(totals.items(), key=lambda item: (-item[1], item[0]))
+        return results[:limit] if limit else results
+
+
+# ----------------------------------
+# MAIN
+# ----------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Search achievements and time the index")
+    parser.add_argument("query", nargs="+")
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--repeats", type=int, default=1000)
+    args = parser.parse_args()
+
+    from src.utils.data_loader import load_catalog
+
+    catalog = load_catalog()
+    query = " ".join(args.query)
+    results = catalog.search.search(query, args.limit)
+    for index, score in results:
+        record = catalog.records[index]
+        print(f"{score:6.2f}  {record.cat1} / {record.cat2}  {record.name}")
+
+    start = time.perf_counter()
+    for _ in range(args.repeats):
+        catalog.search.search(query)
+    per_query = (time.perf_counter() - start) / args.repeats
+    print(f"{len(catalog.search.vocabulary)} tokens indexed, {per_query * 1e6:.1f} us/query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# ----------------------------------
+# IMPORTS
+# ----------------------------------
+import hashlib
+from config.settings import DEFAULT_SEED
+
+# ----------------------------------
+# CONSTANTS
+# ----------------------------------
+SEED_SCHEME = 1
+SEED_KEY = b"root-bingo/seed"
+
+# ----------------------------------
+# FUNCTIONS
+# ----------------------------------
+def normalize_seed(seed):
+    if seed == "" or seed is None:
+        return str(DEFAULT_SEED)
+    return str(seed)
+
+
+def derive_seed(seed, scheme=SEED_SCHEME):
+    """
+    Map a user-entered seed to the integer fed to random.Random.
+    Scheme 1: numeric seeds are used as-is (so existing sheets are unchanged),
+    any other text goes through a keyed blake2b digest, which unlike hash()
+    is identical in every process.
+    """
+    if scheme != 1:
+        raise ValueError(f"Unknown seed scheme {scheme}")
+
+    text = normalize_seed(seed)
+    try:
+        return int(text)
+    except ValueError:
+        digest = hashlib.blake2b(text.encode("utf-8"), key=SEED_KEY, digest_size=4).digest()
+        return int.from_bytes(digest, "big")
+
+
+def seed_digest(seed, scheme=SEED_SCHEME):
+    """
+    Canonical, process-independent identifier for a seed, for cache keys.
+    Seeds that produce the same sheet share a digest.
+    """
+    return f"s{scheme}:{derive_seed(seed, scheme)}"
+
+
+def derive_subseed(seed, n, scheme=SEED_SCHEME):
+    """
+    Deterministic n-th seed derived from `seed`; n = 0 is `seed` itself.
+    """
+    base = derive_seed(seed, scheme)
+    if n == 0:
+        return base
+    text = f"{base}/{n}".encode("utf-8")
+    digest = hashlib.blake2b(text, key=SEED_KEY, digest_size=4).digest()
+    return int.from_bytes(digest, "big")
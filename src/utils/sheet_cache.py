@@ -0,0 +1,121 @@
+# ----------------------------------
+# IMPORTS
+# ----------------------------------
+import threading
+from collections import OrderedDict
+from config.settings import SAMPLER_MODE, SHEET_CACHE_MAX_BYTES, SHEET_CACHE_MAX_ENTRIES
+from src.utils.seeds import seed_digest
+
+# ----------------------------------
+# CONSTANTS
+# ----------------------------------
+CELL_OVERHEAD_BYTES = 256
+
+# ----------------------------------
+# KEYS
+# ----------------------------------
+def sheet_key(catalog_version, seed, difficulty, selected_cat1, selected_faction_cat2, mode=SAMPLER_MODE):
+    """
+    Selections are keyed in the order given: bucket order follows the
+    selection, so the same filters picked in another order are another sheet.
+    """
+    return (catalog_version, mode, seed_digest(seed), difficulty, tuple(selected_cat1), tuple(selected_faction_cat2))
+
+
+def estimate_grid_bytes(grid):
+    if grid is None:
+        return CELL_OVERHEAD_BYTES
+
+    size = 0
+    for row in grid:
+        for cell in row:
+            size += CELL_OVERHEAD_BYTES
+            if cell:
+                size += sum(len(value) for value in cell.values() if isinstance(value, str))
+    return size
+
+
+# ----------------------------------
+# CACHE
+# ----------------------------------
+class SheetCache:
+    """
+    Thread-safe LRU shared by every session in the process, bounded both by
+    entry count and by the approximate bytes held.
+    """
+
+    def __init__(self, max_entries=SHEET_CACHE_MAX_ENTRIES, max_bytes=SHEET_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key, value, size):
+        with self._lock:
+            if size > self.max_bytes:
+                return
+
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+
+            self._entries[key] = (value, size)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _key, (_value, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def get_grid(self, key):
+        return self.get(("grid", key))
+
+    def put_grid(self, key, grid):
+        self.put(("grid", key), grid, estimate_grid_bytes(grid))
+
+    # Exported files show the seed as typed, so "02018" and "2018" share a
+    # grid but not a PDF or image.
+    def get_export(self, kind, key, seed_label):
+        return self.get((kind, key, str(seed_label)))
+
+    def put_export(self, kind, key, seed_label, data):
+        self.put((kind, key, str(seed_label)), data, len(data))
+
+    def get_pdf(self, key, seed_label):
+        return self.get_export("pdf", key, seed_label)
+
+    def put_pdf(self, key, seed_label, pdf_bytes):
+        self.put_export("pdf", key, seed_label, pdf_bytes)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+
+SHEET_CACHE = SheetCache()
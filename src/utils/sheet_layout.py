@@ -0,0 +1,100 @@
+# ----------------------------------
+# IMPORTS
+# ----------------------------------
+from functools import lru_cache
+from reportlab.lib.pagesizes import letter, landscape
+from reportlab.lib.units import inch
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+# ----------------------------------
+# CONSTANTS
+# ----------------------------------
+# Geometry of the printed sheet, in points with the origin at the bottom
+# left. These reproduce the platypus layout in pdf_export: frame padding,
+# title, spacer, centred table and centred cell contents.
+PAGE_SIZE = landscape(letter)
+PAGE_WIDTH, PAGE_HEIGHT = PAGE_SIZE
+MARGIN = 0.25 * inch
+CELL_WIDTH = 2.0 * inch
+CELL_HEIGHT = 1.4 * inch
+ICON_SIZE = 0.4 * inch
+
+FRAME_PADDING = 6
+CELL_PADDING = 4
+TEXT_WIDTH = CELL_WIDTH - 2 * CELL_PADDING
+SPACE_SHRINKAGE = 0.05
+TITLE_FONT = ("Helvetica", 10)
+NAME_FONT = ("Helvetica-Bold", 8, 10)
+CONTENT_FONT = ("Helvetica", 6, 8)
+
+_content_top = PAGE_HEIGHT - MARGIN - FRAME_PADDING
+TITLE_X = PAGE_WIDTH / 2
+TITLE_Y = _content_top - TITLE_FONT[1]
+TABLE_TOP = _content_top - 12 - 5 - 0.1 * inch
+TABLE_LEFT = (PAGE_WIDTH - 5 * CELL_WIDTH) / 2
+TABLE_BOTTOM = TABLE_TOP - 5 * CELL_HEIGHT
+TABLE_RIGHT = TABLE_LEFT + 5 * CELL_WIDTH
+
+# ----------------------------------
+# FUNCTIONS
+# ----------------------------------
+def sheet_title(seed_value, difficulty_text):
+    return f"Seed: {seed_value} | {difficulty_text}"
+
+
+def cell_origin(row, col):
+    """
+    Top-left corner of a grid cell.
+    """
+    return TABLE_LEFT + col * CELL_WIDTH, TABLE_TOP - row * CELL_HEIGHT
+
+
+@lru_cache(maxsize=4096)
+def wrap_text(text, font_name, font_size, width=TEXT_WIDTH):
+    """
+    Greedy word wrap as Paragraph does it, including its allowance for
+    squeezing spaces. Returns ((line, drawn width, word space), ...), where
+    a negative word space shrinks an over-full line back to `width`.
+    """
+    space = stringWidth(" ", font_name, font_size)
+    lines = []
+    words = []
+    line_width = 0
+    for word in text.split():
+        word_width = stringWidth(word, font_name, font_size)
+        if words and line_width + space + word_width > width + SPACE_SHRINKAGE * space * len(words):
+            lines.append(fit_line(words, line_width, width))
+            words = []
+        line_width = line_width + space + word_width if words else word_width
+        words.append(word)
+    if words:
+        lines.append(fit_line(words, line_width, width))
+    return tuple(lines)
+
+
+def fit_line(words, line_width, width):
+    if line_width > width and len(words) > 1:
+        return " ".join(words), width, (width - line_width) / (len(words) - 1)
+    return " ".join(words), line_width, 0
+
+
+def layout_cell(cell, left, top, has_icon):
+    """
+    Returns (center x, icon top or None, name top, name lines, content top,
+    content lines) for a cell whose top-left corner is (left, top). The
+    contents are centred vertically as the table's VALIGN MIDDLE does.
+    """
+    name_lines = wrap_text(cell["name"], *NAME_FONT[:2])
+    content_lines = wrap_text(cell["content"], *CONTENT_FONT[:2])
+    height = (ICON_SIZE if has_icon else 0) + len(name_lines) * NAME_FONT[2] + len(content_lines) * CONTENT_FONT[2]
+
+    center_x = left + CELL_WIDTH / 2
+    y = top - CELL_PADDING - (CELL_HEIGHT - 2 * CELL_PADDING - height) / 2
+    icon_top = None
+    if has_icon:
+        icon_top = y
+        y -= ICON_SIZE
+
+    name_top = y
+    content_top = name_top - len(name_lines) * NAME_FONT[2]
+    return center_x, icon_top, name_top, name_lines, content_top, content_lines
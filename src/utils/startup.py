@@ -0,0 +1,115 @@
+# ----------------------------------
+# IMPORTS
+# ----------------------------------
+import argparse
+import subprocess
+import sys
+from collections import defaultdict
+from config.settings import PROJECT_ROOT, STARTUP_IMPORT_BUDGET_MS, STARTUP_LAZY_MODULES
+
+# ----------------------------------
+# CONSTANTS
+# ----------------------------------
+ENTRY_MODULE = "app"
+
+# ----------------------------------
+# MEASURE
+# ----------------------------------
+def import_times(module=ENTRY_MODULE):
+    """
+    Import `module` in a fresh interpreter with -X importtime. Returns
+    [(name, depth, self us, cumulative us)] in the order Python reports
+    them, children before their parent.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{completed.stderr}")
+
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return rows
+
+
+def subtree(rows, module=ENTRY_MODULE):
+    """
+    Rows of `module` and everything it imported, itself last. Interpreter
+    startup (site, encodings, ...) is left out.
+    """
+    for i, (name, depth, _self_us, _cumulative_us) in enumerate(rows):
+        if name == module:
+            start = i
+            while start > 0 and rows[start - 1][1] > depth:
+                start -= 1
+            return rows[start:i + 1]
+    return []
+
+
+def module_total(rows, module=ENTRY_MODULE):
+    tree = subtree(rows, module)
+    return tree[-1][3] if tree else 0
+
+
+def package_totals(rows):
+    """
+    Self time summed per top-level package, largest first.
+    """
+    totals = defaultdict(int)
+    for name, _depth, self_us, _cumulative_us in rows:
+        totals[name.split(".")[0]] += self_us
+    return sorted(totals.items(), key=lambda item: -item[1])
+
+
+def lazy_modules_loaded(rows, lazy_modules=STARTUP_LAZY_MODULES):
+    loaded = {name.split(".")[0] for name, *_rest in rows}
+    return [module for module in lazy_modules if module in loaded]
+
+
+# ----------------------------------
+# MAIN
+# ----------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Report cold import time of app.py and check it against the budget")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters to time; the fastest counts")
+    parser.add_argument("--budget", type=float, default=STARTUP_IMPORT_BUDGET_MS, help="budget in ms")
+    parser.add_argument("--top", type=int, default=10, help="packages to list in the report")
+    args = parser.parse_args()
+
+    runs = [import_times() for _ in range(max(args.runs, 1))]
+    rows = subtree(min(runs, key=module_total))
+    total_ms = module_total(rows) / 1000
+
+    print(f"Cold import of {ENTRY_MODULE}.py: {total_ms:.1f} ms (fastest of {len(runs)}), budget {args.budget:.0f} ms")
+    print("Self time by package:")
+    for package, self_us in package_totals(rows)[:args.top]:
+        print(f"  {package:<24} {self_us / 1000:8.1f} ms")
+    print(f"Direct imports of {ENTRY_MODULE}:")
+    root_depth = rows[-1][1] if rows else 0
+    for name, depth, _self_us, cumulative_us in rows:
+        if depth == root_depth + 1:
+            print(f"  {name:<24} {cumulative_us / 1000:8.1f} ms")
+
+    failures = []
+    if total_ms > args.budget:
+        failures.append(f"over budget by {total_ms - args.budget:.1f} ms")
+    loaded = lazy_modules_loaded(rows)
+    if loaded:
+        failures.append(f"loaded at startup: {', '.join(loaded)}")
+
+    if failures:
+        print("FAIL: " + "; ".join(failures), file=sys.stderr)
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+# ----------------------------------
+# IMPORTS
+# ----------------------------------
+import argparse
+import io
+import time
+from functools import lru_cache
+from xml.sax.saxutils import escape
+from PIL import Image, ImageDraw, ImageFont
+from src.utils.icons import inline_icon_uri, pdf_icon_path
+from config.settings import ICONS_DIR
+from src.utils.sheet_layout import (
+    PAGE_WIDTH,
+    PAGE_HEIGHT,
+    CELL_WIDTH,
+    CELL_HEIGHT,
+    ICON_SIZE,
+    TITLE_FONT,
+    NAME_FONT,
+    CONTENT_FONT,
+    TITLE_X,
+    TITLE_Y,
+    TABLE_TOP,
+    TABLE_LEFT,
+    TABLE_BOTTOM,
+    TABLE_RIGHT,
+    cell_origin,
+    layout_cell,
+    sheet_title,
+)
+
+# ----------------------------------
+# CONSTANTS
+# ----------------------------------
+# Same page as the PDF, in the same units, with y flipped to point down.
+FONT_FAMILY = "Helvetica, Arial, sans-serif"
+HIGHLIGHT = "#ffffe0"
+PNG_SCALE = 2
+PNG_COMPRESS_LEVEL = 3
+PNG_COLORS = 64
+SVG_ICON_QUALITY = 85
+
+# ----------------------------------
+# SVG
+# ----------------------------------
+def fmt(value):
+    return f"{value:.2f}".rstrip("0").rstrip(".")
+
+
+@lru_cache(maxsize=1)
+def svg_template():
+    """
+    Document head and the static frame: styles, page, centre highlight and
+    grid lines. Built once per process.
+    """
+    lines = "".join(
+        f"M{fmt(TABLE_LEFT + i * CELL_WIDTH)} {fmt(PAGE_HEIGHT - TABLE_TOP)}V{fmt(PAGE_HEIGHT - TABLE_BOTTOM)}"
+        f"M{fmt(TABLE_LEFT)} {fmt(PAGE_HEIGHT - TABLE_TOP + i * CELL_HEIGHT)}H{fmt(TABLE_RIGHT)}"
+        for i in range(6)
+    )
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+        f'viewBox="0 0 {fmt(PAGE_WIDTH)} {fmt(PAGE_HEIGHT)}" width="{fmt(PAGE_WIDTH)}" height="{fmt(PAGE_HEIGHT)}">'
+        f'<rect width="100%" height="100%" fill="#fff"/>'
+        f'<rect x="{fmt(TABLE_LEFT + 2 * CELL_WIDTH)}" y="{fmt(PAGE_HEIGHT - TABLE_TOP + 2 * CELL_HEIGHT)}" '
+        f'width="{fmt(CELL_WIDTH)}" height="{fmt(CELL_HEIGHT)}" fill="{HIGHLIGHT}"/>'
+        f'<path d="{lines}" stroke="#000" stroke-width="1" fill="none"/>'
+    )
+
+
+def icon_data_uri(icon_path):
+    # Sized for a 2x screen.
+    return inline_icon_uri(icon_path, round(ICON_SIZE * PNG_SCALE), SVG_ICON_QUALITY)
+
+
+# Text styles are presentation attributes on every <text>: some SVG
+# renderers support neither CSS nor inheriting them from a group.
+_text = f'font-family="{FONT_FAMILY}" text-anchor="middle"'
+TEXT_STYLES = {
+    "title": f'{_text} font-size="{TITLE_FONT[1]}"',
+    "name": f'{_text} font-size="{NAME_FONT[1]}" font-weight="bold"',
+    "elite": f'{_text} font-size="{NAME_FONT[1]}" font-weight="bold" text-decoration="underline"',
+    "content": f'{_text} font-size="{CONTENT_FONT[1]}"',
+}
+
+
+def svg_text_lines(parts, lines, font, style, center_x, top):
+    _font_name, font_size, leading = font
+    baseline = top - font_size
+    for line, _line_width, word_space in lines:
+        spacing = f' word-spacing="{fmt(word_space)}"' if word_space else ""
+        parts.append(
+            f'<text {TEXT_STYLES[style]} x="{fmt(center_x)}" y="{fmt(PAGE_HEIGHT - baseline)}"{spacing}>{escape(line)}</text>'
+        )
+        baseline -= leading
+
+
+def render_svg(grid, seed_value, difficulty_text):
+    """
+    Standalone SVG of a sheet. Each icon is embedded once in <defs> and
+    referenced from its cells.
+    """
+    parts = [svg_template()]
+    body = []
+    icon_ids = {}
+
+    for row in range(5):
+        for col in range(5):
+            cell = grid[row][col]
+            if not cell:
+                continue
+
+            icon_path = cell["icon"]
+            if icon_path and icon_path not in icon_ids:
+                try:
+                    icon_ids[icon_path] = (f"i{len(icon_ids)}", icon_data_uri(icon_path))
+                except OSError:
+                    icon_ids[icon_path] = None
+            has_icon = bool(icon_path) and icon_ids[icon_path] is not None
+
+            left, top = cell_origin(row, col)
+            center_x, icon_top, name_top, name_lines, content_top, content_lines = layout_cell(cell, left, top, has_icon)
+            if has_icon:
+                body.append(
+                    f'<use xlink:href="#{icon_ids[icon_path][0]}" x="{fmt(center_x - ICON_SIZE / 2)}" y="{fmt(PAGE_HEIGHT - icon_top)}"/>'
+                )
+            svg_text_lines(body, name_lines, NAME_FONT, "elite" if cell.get("is_elite") else "name", center_x, name_top)
+            svg_text_lines(body, content_lines, CONTENT_FONT, "content", center_x, content_top)
+
+    if icon_ids:
+        parts.append("<defs>")
+        for icon in icon_ids.values():
+            if icon:
+                parts.append(
+                    f'<image id="{icon[0]}" width="{fmt(ICON_SIZE)}" height="{fmt(ICON_SIZE)}" xlink:href="{icon[1]}"/>'
+                )
+        parts.append("</defs>")
+
+    title = escape(sheet_title(seed_value, difficulty_text))
+    parts.append(f'<text {TEXT_STYLES["title"]} x="{fmt(TITLE_X)}" y="{fmt(PAGE_HEIGHT - TITLE_Y)}">{title}</text>')
+    parts.extend(body)
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+# ----------------------------------
+# PNG
+# ----------------------------------
+# Drawn with Pillow from the same layout, so no SVG rasterizer is needed.
+# Lines are wrapped with Helvetica metrics and centred, so the bundled font
+# lands where the PDF text does. The PNG is for places that only take a
+# raster; it costs more than the PDF to make and to send, so the SVG stays
+# the share format.
+@lru_cache(maxsize=4)
+def png_template(scale):
+    image = Image.new("RGB", (round(PAGE_WIDTH * scale), round(PAGE_HEIGHT * scale)), "white")
+    draw = ImageDraw.Draw(image)
+    x0, y0 = TABLE_LEFT + 2 * CELL_WIDTH, PAGE_HEIGHT - TABLE_TOP + 2 * CELL_HEIGHT
+    draw.rectangle([x0 * scale, y0 * scale, (x0 + CELL_WIDTH) * scale, (y0 + CELL_HEIGHT) * scale], fill=HIGHLIGHT)
+    for i in range(6):
+        x = (TABLE_LEFT + i * CELL_WIDTH) * scale
+        y = (PAGE_HEIGHT - TABLE_TOP + i * CELL_HEIGHT) * scale
+        draw.line([x, (PAGE_HEIGHT - TABLE_TOP) * scale, x, (PAGE_HEIGHT - TABLE_BOTTOM) * scale], fill="black", width=scale)
+        draw.line([TABLE_LEFT * scale, y, TABLE_RIGHT * scale, y], fill="black", width=scale)
+    return image
+
+
+@lru_cache(maxsize=4)
+def png_palette(scale):
+    """
+    Fixed palette for every sheet: the frame, anti-aliased text on white and
+    on the highlight, and all icons. Mapping each sheet onto it costs a
+    fraction of encoding the RGB image, and the file shrinks about 3x.
+    """
+    icons = []
+    for icon_path in sorted(ICONS_DIR.glob("*.png")):
+        try:
+            icons.append(png_icon(str(icon_path), scale))
+        except OSError:
+            continue
+
+    template = png_template(scale)
+    px = round(ICON_SIZE * scale)
+    swatch = Image.new("RGB", (template.width + px * max(len(icons), 1), max(template.height, 512)), "white")
+    swatch.paste(template, (0, 0))
+    for i, icon in enumerate(icons):
+        swatch.paste(icon, (template.width + i * px, 0))
+
+    # Text edges blend black into either background.
+    draw = ImageDraw.Draw(swatch)
+    for i, background in enumerate(("#ffffff", HIGHLIGHT)):
+        bg = Image.new("RGB", (1, 1), background).getpixel((0, 0))
+        for level in range(256):
+            shade = tuple(round(channel * level / 255) for channel in bg)
+            draw.line([(template.width + level, px + 8 + 8 * i), (template.width + level, px + 15 + 8 * i)], fill=shade)
+
+    return swatch.quantize(PNG_COLORS, method=Image.Quantize.MEDIANCUT)
+
+
+@lru_cache(maxsize=16)
+def png_font(size):
+    return ImageFont.load_default(size=size)
+
+
+@lru_cache(maxsize=128)
+def png_icon(icon_path, scale):
+    with Image.open(pdf_icon_path(icon_path)) as image:
+        px = round(ICON_SIZE * scale)
+        return image.convert("RGB").resize((px, px), Image.LANCZOS)
+
+
+@lru_cache(maxsize=4096)
+def png_line(text, size, bold=False):
+    """
+    Rendered text line as an (L mask, left, top, width) relative to its
+    centred baseline. Achievement text repeats across sheets, so drawing
+    it once and pasting is far cheaper than rendering glyphs every time.
+    """
+    font = png_font(size)
+    stroke = 1 if bold else 0
+    left, top, right, bottom = font.getbbox(text, anchor="ms", stroke_width=stroke)
+    mask = Image.new("L", (max(right - left, 1), max(bottom - top, 1)), 0)
+    ImageDraw.Draw(mask).text((-left, -top), text, fill=255, font=font, anchor="ms", stroke_width=stroke)
+    return mask, left, top, font.getlength(text)
+
+
+def png_text_lines(image, lines, font, center_x, top, scale, bold=False, underline=False):
+    _font_name, font_size, leading = font
+    baseline = top - font_size
+    for line, _line_width, _word_space in lines:
+        x, y = round(center_x * scale), round((PAGE_HEIGHT - baseline) * scale)
+        mask, left, mask_top, width = png_line(line, round(font_size * scale), bold)
+        image.paste("black", (x + left, y + mask_top), mask)
+        if underline:
+            offset = round((0.125 * font_size + 0.5) * scale)
+            image.paste("black", (round(x - width / 2), y + offset, round(x + width / 2), y + offset + scale))
+        baseline -= leading
+
+
+def render_png(grid, seed_value, difficulty_text, scale=PNG_SCALE):
+    """
+    Palette PNG of a sheet at `scale` pixels per point. Below 2x the
+    6 pt rule text is unreadable.
+    """
+    image = png_template(scale).copy()
+    ImageDraw.Draw(image).text(
+        (TITLE_X * scale, (PAGE_HEIGHT - TITLE_Y) * scale),
+        sheet_title(seed_value, difficulty_text),
+        fill="black",
+        font=png_font(TITLE_FONT[1] * scale),
+        anchor="ms",
+    )
+
+    for row in range(5):
+        for col in range(5):
+            cell = grid[row][col]
+            if not cell:
+                continue
+
+            icon = None
+            if cell["icon"]:
+                try:
+                    icon = png_icon(cell["icon"], scale)
+                except OSError:
+                    icon = None
+
+            left, top = cell_origin(row, col)
+            center_x, icon_top, name_top, name_lines, content_top, content_lines = layout_cell(cell, left, top, icon is not None)
+            if icon:
+                image.paste(icon, (round((center_x - ICON_SIZE / 2) * scale), round((PAGE_HEIGHT - icon_top) * scale)))
+            png_text_lines(image, name_lines, NAME_FONT, center_x, name_top, scale, bold=True, underline=cell.get("is_elite"))
+            png_text_lines(image, content_lines, CONTENT_FONT, center_x, content_top, scale)
+
+    image = image.quantize(palette=png_palette(scale), dither=Image.Dither.NONE)
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG", compress_level=PNG_COMPRESS_LEVEL)
+    return buffer.getvalue()
+
+
+# ----------------------------------
+# MAIN
+# ----------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Compare render time and size of the sheet formats")
+    parser.add_argument("--sheets", type=int, default=100)
+    args = parser.parse_args()
+
+    from src.utils.data_loader import load_catalog
+    from src.utils.grid import grid_placer
+    from src.utils.pdf_export import generate_pdf
+    from src.utils.sampler import sampler
+
+    catalog = load_catalog()
+    factions = sorted(catalog.achievements.get("Faction", {}).keys())
+    grids = [
+        grid_placer(catalog, sampler(catalog, seed, "Mixed", ["General", "Faction"], factions))
+        for seed in range(args.sheets)
+    ]
+
+    renderers = (
+        ("pdf", lambda grid, seed: generate_pdf(grid, seed, "Mixed").getvalue()),
+        ("svg", lambda grid, seed: render_svg(grid, seed, "Mixed").encode("utf-8")),
+        ("png", lambda grid, seed: render_png(grid, seed, "Mixed")),
+    )
+    for name, render in renderers:
+        render(grids[0], 0)
+        start = time.perf_counter()
+        size = 0
+        for seed, grid in enumerate(grids):
+            size += len(render(grid, seed))
+        per_sheet = (time.perf_counter() - start) / len(grids)
+        print(f"{name}  {per_sheet * 1000:6.2f} ms/sheet  {size / len(grids) / 1024:6.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
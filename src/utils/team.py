@@ -0,0 +1,250 @@
+# ----------------------------------
+# IMPORTS
+# ----------------------------------
+import random
+from config.settings import SAMPLER_MODE
+from src.utils.sampler import SHEET_CELLS, prepare_plan, sample_indices
+from src.utils.seeds import derive_subseed
+
+# ----------------------------------
+# CONSTANTS
+# ----------------------------------
+DEFAULT_ATTEMPTS_PER_PLAYER = 10
+REPAIR_STEPS = 48
+
+# ----------------------------------
+# BITSETS
+# ----------------------------------
+def sheet_bitset(sampled):
+    bits = 0
+    for index, _is_elite in sampled:
+        bits |= 1 << index
+    return bits
+
+
+def overlap(bits_a, bits_b):
+    return (bits_a & bits_b).bit_count()
+
+
+def elite_count(sampled):
+    return sum(1 for _index, is_elite in sampled if is_elite)
+
+
+# ----------------------------------
+# SPREAD SAMPLING
+# ----------------------------------
+# Same bucket quotas and Normal/Elite halves as the sampler, but inside each
+# bucket the least used achievements so far win (ties broken at random), so
+# later players' sheets steer away from what earlier players already have.
+def least_used(candidates, count, usage, rng, exclude=()):
+    ranked = sorted(
+        (index for index in candidates if index not in exclude),
+        key=lambda index: (usage.get(index, 0), rng.random()),
+    )
+    return ranked[:count]
+
+
+def spread_sample(records, plan, rng, usage):
+    buckets = list(plan.buckets.values())
+    if not buckets:
+        return []
+
+    base_per_bucket, remainder = divmod(SHEET_CELLS, len(buckets))
+    bonus = set(rng.sample(range(len(buckets)), remainder))
+    mixed = plan.difficulty_code == "m"
+
+    sampled = []
+    used = set()
+
+    for b, bucket in enumerate(buckets):
+        count = base_per_bucket + (1 if b in bonus else 0)
+
+        if mixed:
+            normal_count = (count + 1) // 2
+            for index in least_used(bucket.normal + bucket.both, normal_count, usage, rng):
+                sampled.append((index, False))
+                used.add(index)
+            for index in least_used(bucket.elite + bucket.both, count - normal_count, usage, rng, used):
+                sampled.append((index, True))
+                used.add(index)
+        else:
+            for index in least_used(bucket.items, count, usage, rng):
+                sampled.append((index, None))
+                used.add(index)
+
+    missing = SHEET_CELLS - len(sampled)
+    if missing > 0:
+        leftovers = [index for bucket in buckets for index in bucket.items]
+        for index in least_used(leftovers, missing, usage, rng, used):
+            sampled.append((index, None))
+
+    is_elite = plan.difficulty_code == "e"
+    rng.shuffle(sampled)
+    return [
+        (index, flag if flag is not None else is_elite or records[index].mode == "Elite")
+        for index, flag in sampled
+    ]
+
+
+def excess_overlap(bits, bitsets, max_overlap):
+    return sum(max(0, overlap(bits, other) - max_overlap) for other in bitsets)
+
+
+def repair_overlap(sampled, bitsets, max_overlap, plan, bucket_of, records, rng, usage):
+    """
+    Swap cells for unused achievements from the same bucket (and, in mixed
+    mode, the same Normal/Elite half) while that lowers the total overlap
+    above `max_overlap` against the accepted sheets.
+    """
+    sampled = list(sampled)
+    bits = sheet_bitset(sampled)
+    excess = excess_overlap(bits, bitsets, max_overlap)
+    mixed = plan.difficulty_code == "m"
+
+    for _ in range(REPAIR_STEPS):
+        if excess == 0:
+            break
+
+        violating = [other for other in bitsets if overlap(bits, other) > max_overlap]
+        positions = sorted(
+            range(len(sampled)),
+            key=lambda p: (-sum(1 for other in violating if other >> sampled[p][0] & 1), rng.random()),
+        )
+
+        best = None
+        for position in positions[:4]:
+            index, is_elite = sampled[position]
+            bucket = bucket_of[index]
+            if mixed:
+                options = (bucket.elite if is_elite else bucket.normal) + bucket.both
+            else:
+                options = bucket.items
+
+            for option in options:
+                if bits >> option & 1:
+                    continue
+                new_bits = (bits & ~(1 << index)) | (1 << option)
+                score = (excess_overlap(new_bits, bitsets, max_overlap), usage.get(option, 0), rng.random())
+                if best is None or score < best[0]:
+                    best = (score, position, option, new_bits)
+
+        if best is None or best[0][0] >= excess:
+            break
+
+        (excess, _usage, _tie), position, option, bits = best
+        is_elite = sampled[position][1]
+        if not mixed:
+            is_elite = plan.difficulty_code == "e" or records[option].mode == "Elite"
+        sampled[position] = (option, is_elite)
+
+    return sampled, bits
+
+
+# ----------------------------------
+# TEAM SHEETS
+# ----------------------------------
+class TeamSheets:
+    """
+    Sheets for the players of one team. Each sheet is a bitset over catalog
+    record indices (centre Bingo cell excluded, every sheet shares it), so a
+    pairwise overlap is one AND and a popcount.
+    """
+
+    __slots__ = ("catalog", "plan", "subseeds", "sheets", "bitsets", "max_overlap", "attempts")
+
+    def __init__(self, catalog, plan, max_overlap):
+        self.catalog = catalog
+        self.plan = plan
+        self.max_overlap = max_overlap
+        self.subseeds = []
+        self.sheets = []
+        self.bitsets = []
+        self.attempts = 0
+
+    def __len__(self):
+        return len(self.sheets)
+
+    def sheet(self, i):
+        records = self.catalog.records
+        result = [self.plan.difficulty_code, (self.plan.bingo_id, self.plan.difficulty_code != "n")]
+        for index, is_elite in self.sheets[i]:
+            result.append((records[index].id, is_elite))
+        return result
+
+    def overlap_matrix(self):
+        return [[overlap(a, b) for b in self.bitsets] for a in self.bitsets]
+
+    def max_pairwise_overlap(self):
+        return max(
+            (overlap(a, b) for i, a in enumerate(self.bitsets) for b in self.bitsets[i + 1:]),
+            default=0,
+        )
+
+
+def generate_team(
+    catalog,
+    team_seed,
+    players,
+    difficulty,
+    selected_cat1,
+    selected_faction_cat2,
+    max_overlap,
+    max_elite_spread=1,
+    max_attempts=None,
+    mode=SAMPLER_MODE,
+):
+    """
+    Deterministically pick `players` sheets whose pairwise overlap is at most
+    `max_overlap` achievements. Player 1 gets the sheet a solo run of
+    `team_seed` would; later candidates come from sub-seeds of `team_seed`
+    through spread_sample(), which keeps the sampler's bucket quotas while
+    preferring achievements earlier sheets have not used, and are then
+    repaired within their buckets toward the overlap bound. In mixed mode,
+    elite cell counts stay within `max_elite_spread` of player 1 so sheets
+    are comparably hard.
+
+    Returns None when there is no Bingo achievement for `difficulty`, and a
+    TeamSheets with fewer than `players` sheets when the attempt budget ran
+    out first.
+    """
+    plan = prepare_plan(catalog, difficulty, selected_cat1, selected_faction_cat2, mode)
+    if plan is None:
+        return None
+
+    if max_attempts is None:
+        max_attempts = DEFAULT_ATTEMPTS_PER_PLAYER * players
+
+    team = TeamSheets(catalog, plan, max_overlap)
+    records = catalog.records
+    usage = {}
+    bucket_of = {index: bucket for bucket in plan.buckets.values() for index in bucket.items}
+    target_elite = None
+
+    while len(team) < players and team.attempts < max_attempts:
+        subseed = derive_subseed(team_seed, team.attempts)
+        team.attempts += 1
+
+        if not team.sheets:
+            sampled = sample_indices(records, plan, subseed)
+            bits = sheet_bitset(sampled)
+        else:
+            rng = random.Random(subseed)
+            sampled = spread_sample(records, plan, rng, usage)
+            sampled, bits = repair_overlap(sampled, team.bitsets, max_overlap, plan, bucket_of, records, rng, usage)
+
+        if any(overlap(bits, other) > max_overlap for other in team.bitsets):
+            continue
+
+        elites = elite_count(sampled)
+        if target_elite is not None and abs(elites - target_elite) > max_elite_spread:
+            continue
+        if target_elite is None:
+            target_elite = elites
+
+        team.subseeds.append(subseed)
+        team.sheets.append(sampled)
+        team.bitsets.append(bits)
+        for index, _is_elite in sampled:
+            usage[index] = usage.get(index, 0) + 1
+
+    return team
@@ -0,0 +1,142 @@
+# ----------------------------------
+# IMPORTS
+# ----------------------------------
+import threading
+from html import escape
+from src.utils.data_loader import MODES
+from src.utils.formatting import format_wiki_html
+from src.utils.icons import sprite_css, sprite_icon_html
+
+# ----------------------------------
+# CONSTANTS
+# ----------------------------------
+# The wiki is sent as one HTML element of nested <details>. The browser
+# only lays out a section once it is opened, and the server only joins
+# prebuilt strings, so a rerun costs the same whatever the catalog size.
+ICON_SIZE = 20
+WIKI_CSS = """
+<style>
+.bingo-wiki details {
+    border: 1px solid rgba(128, 128, 128, 0.3);
+    border-radius: 0.5rem;
+    padding: 0.25rem 0.75rem;
+    margin: 0.5rem 0;
+}
+.bingo-wiki summary {
+    cursor: pointer;
+    font-weight: 600;
+    padding: 0.25rem 0;
+}
+.bingo-wiki ul {
+    margin: 0.25rem 0;
+    padding-left: 1.25rem;
+}
+.bingo-wiki li {
+    margin: 0.25rem 0;
+}
+.bingo-wiki .note {
+    cursor: help;
+}
+%s
+</style>
+"""
+
+_lock = threading.Lock()
+_cache = {"version": None, "wiki": None}
+
+# ----------------------------------
+# BUILD
+# ----------------------------------
+class WikiSection:
+    """
+    One Category 2 block of the wiki, rendered once per catalog version.
+    """
+
+    __slots__ = ("cat1", "cat2", "count", "html")
+
+    def __init__(self, cat1, cat2, count, html):
+        self.cat1 = cat1
+        self.cat2 = cat2
+        self.count = count
+        self.html = html
+
+
+def entry_html(record):
+    icon = sprite_icon_html(record.icon_path, ICON_SIZE) or ""
+    note = ""
+    if record.notes:
+        note = f' <span class="note" title="{escape(record.notes)}">ℹ️</span>'
+    return f"<li>{icon} {format_wiki_html(record.data)}{note}</li>"
+
+
+def section_html(group, entries):
+    parts = [f"<details><summary>{escape(str(group.cat2))}</summary>"]
+    for mode in MODES:
+        mode_indices = group.by_mode[mode]
+        if mode_indices:
+            items = "".join(entries[i] for i in mode_indices)
+            parts.append(f"<details><summary>{mode}</summary><ul>{items}</ul></details>")
+    parts.append("</details>")
+    return "".join(parts)
+
+
+class Wiki:
+    """
+    Prebuilt wiki of a catalog: `entries` holds each record's list item by
+    record index, `sections` is {cat1: [WikiSection, ...]} in catalog order.
+    """
+
+    __slots__ = ("entries", "sections")
+
+    def __init__(self, catalog):
+        self.entries = tuple(entry_html(record) for record in catalog.records)
+        self.sections = {}
+        for (cat1, cat2), group in catalog.groups.items():
+            count = group.stop - group.start
+            section = WikiSection(cat1, cat2, count, section_html(group, self.entries))
+            self.sections.setdefault(cat1, []).append(section)
+
+
+def get_wiki(catalog):
+    """
+    The wiki for `catalog`, built once per catalog version.
+    """
+    with _lock:
+        if _cache["version"] == catalog.version and _cache["wiki"] is not None:
+            return _cache["wiki"]
+
+    wiki = Wiki(catalog)
+    with _lock:
+        _cache["version"] = catalog.version
+        _cache["wiki"] = wiki
+    return wiki
+
+
+# ----------------------------------
+# RENDER
+# ----------------------------------
+def wiki_css():
+    return WIKI_CSS % sprite_css(ICON_SIZE)
+
+
+def wiki_html(catalog, selected_cat1, selected_cat2):
+    wiki = get_wiki(catalog)
+    selected_cat2 = set(selected_cat2)
+    parts = [wiki_css(), '<div class="bingo-wiki">']
+
+    for cat1 in selected_cat1:
+        sections = [section.html for section in wiki.sections.get(cat1, ()) if section.cat2 in selected_cat2]
+        if sections:
+            parts.append(f"<details open><summary>{escape(str(cat1))}</summary>{''.join(sections)}</details>")
+
+    parts.append("</div>")
+    return "".join(parts)
+
+
+def search_html(catalog, indices):
+    """
+    Flat list of the records at `indices`, in the given order.
+    """
+    wiki = get_wiki(catalog)
+    items = "".join(wiki.entries[i] for i in indices)
+    return f'{wiki_css()}<div class="bingo-wiki"><ul>{items}</ul></div>'